@@ -43,8 +43,10 @@ class LLMNodeIntegration:
             prompt=prompt,
             context=LLMContext.PLANNING,
             system_prompt=PLAN_SYSTEM,
-            temperature=self.llm_config.get_temperature_for_context("planning"),
-            max_tokens=self.llm_config.get_max_tokens_for_context("planning"),
+            temperature=self.llm_config.get_temperature_for_context(
+                LLMContext.PLANNING
+            ),
+            max_tokens=self.llm_config.get_max_tokens_for_context(LLMContext.PLANNING),
         )
 
         response = await self.manager.generate_with_fallback(request)
@@ -83,8 +85,12 @@ class LLMNodeIntegration:
             prompt=prompt,
             context=LLMContext.SQL_GENERATION,
             system_prompt=SQL_SYSTEM,
-            temperature=self.llm_config.get_temperature_for_context("sql_generation"),
-            max_tokens=self.llm_config.get_max_tokens_for_context("sql_generation"),
+            temperature=self.llm_config.get_temperature_for_context(
+                LLMContext.SQL_GENERATION
+            ),
+            max_tokens=self.llm_config.get_max_tokens_for_context(
+                LLMContext.SQL_GENERATION
+            ),
         )
 
         response = await self.manager.generate_with_fallback(request)
@@ -124,8 +130,10 @@ class LLMNodeIntegration:
             prompt=prompt,
             context=LLMContext.ANALYSIS,
             system_prompt=REPORT_SYSTEM,
-            temperature=self.llm_config.get_temperature_for_context("analysis"),
-            max_tokens=self.llm_config.get_max_tokens_for_context("analysis"),
+            temperature=self.llm_config.get_temperature_for_context(
+                LLMContext.ANALYSIS
+            ),
+            max_tokens=self.llm_config.get_max_tokens_for_context(LLMContext.ANALYSIS),
         )
 
         response = await self.manager.generate_with_fallback(request)
@@ -10,7 +10,7 @@ from jinja2 import Template
 from sqlglot import exp
 
 from ..bq import get_schema, run_query
-from ..config import LGDAConfig, settings
+from ..config import ConfigFactory, settings
 from ..llm import llm_completion
 from .llm_integration import get_llm_integration
 from .prompts import PLAN_SYSTEM, REPORT_SYSTEM, SQL_SYSTEM
@@ -287,6 +287,38 @@ def _validate_syntax_strictly(sql: str) -> None:
         raise ValueError("SQL parse error: Incomplete FROM clause")
 
 
+# Checked in order; the first pattern that matches is reported
+_DML_DDL_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\bdrop\s+table\b",
+        r"\bcreate\s+table\b",
+        r"\balter\s+table\b",
+        r"\btruncate\s+table\b",
+        r"\binsert\s+into\b",
+        r"\bupdate\s+\w+\s+set\b",
+        r"\bdelete\s+from\b",
+        r"\bmerge\s+\w+\s+using\b",
+    )
+)
+_INJECTION_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\bgrant\s+",
+        r"\brevoke\s+",
+        r"\bexec\s*\(",
+        r"\bexecute\s*\(",
+        r"\bsp_\w+",
+        r"\bxp_\w+",
+        r"\binformation_schema\.",
+        r"\bsys\.",
+        r"\badmin_\w+",
+        r"\bpassword\b",
+        r"\bsecret\b",
+    )
+)
+
+
 def _check_injection_patterns(sql: str) -> None:
     """Check for common SQL injection patterns."""
     sql_lower = sql.lower().strip()
@@ -311,43 +343,17 @@ def _check_injection_patterns(sql: str) -> None:
         )
 
     # DML/DDL disallowed (prefer policy message expected by tests)
-    dml_ddl_patterns = [
-        r"\bdrop\s+table\b",
-        r"\bcreate\s+table\b",
-        r"\balter\s+table\b",
-        r"\btruncate\s+table\b",
-        r"\binsert\s+into\b",
-        r"\bupdate\s+\w+\s+set\b",
-        r"\bdelete\s+from\b",
-        r"\bmerge\s+\w+\s+using\b",
-    ]
-    for pattern in dml_ddl_patterns:
-        if re.search(pattern, sql_lower):
-            kw = re.search(pattern, sql_lower).group()
+    for pattern in _DML_DDL_PATTERNS:
+        if match := pattern.search(sql_lower):
             raise ValueError(
-                f"Only SELECT queries are allowed. Forbidden pattern '{kw}' detected - potential security violation"
+                f"Only SELECT queries are allowed. Forbidden pattern '{match.group()}' detected - potential security violation"
             )
 
     # Other dangerous keywords used in injections
-    injection_patterns = [
-        r"\bgrant\s+",
-        r"\brevoke\s+",
-        r"\bexec\s*\(",
-        r"\bexecute\s*\(",
-        r"\bsp_\w+",
-        r"\bxp_\w+",
-        r"\binformation_schema\.",
-        r"\bsys\.",
-        r"\badmin_\w+",
-        r"\bpassword\b",
-        r"\bsecret\b",
-    ]
-    for pattern in injection_patterns:
-        if re.search(pattern, sql_lower):
-            match = re.search(pattern, sql_lower)
-            kw = match.group()
+    for pattern in _INJECTION_PATTERNS:
+        if match := pattern.search(sql_lower):
             raise ValueError(
-                f"Forbidden pattern '{kw}' detected - potential security violation"
+                f"Forbidden pattern '{match.group()}' detected - potential security violation"
             )
 
 
@@ -480,7 +486,7 @@ def analyze_df_node(state: AgentState) -> AgentState:
     """Analyze DataFrame with strict error checking to prevent fabrication on error paths."""
 
     # Get configuration for strict mode (default: True)
-    config = LGDAConfig()
+    config = ConfigFactory.create_config()
     strict_mode = getattr(config, "strict_no_fake_report", True)
 
     # Strict fail-fast check: if error exists, do not generate any analysis content
@@ -519,7 +525,7 @@ def report_node(state: AgentState) -> AgentState:
     """Generate report with strict error checking to prevent fabrication on error paths."""
 
     # Get configuration for strict mode (default: True)
-    config = LGDAConfig()
+    config = ConfigFactory.create_config()
     strict_mode = getattr(config, "strict_no_fake_report", True)
 
     # Enhanced fail-fast check: if error exists, do not generate any report content
@@ -7,7 +7,10 @@ import os
 import random
 import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, NamedTuple, Optional
 
 from google.api_core.exceptions import (
     BadRequest,
@@ -17,12 +20,24 @@ from google.api_core.exceptions import (
     ServerError,
     TooManyRequests,
 )
-from google.cloud import bigquery
 
 from .bq_errors import QueryTimeoutError, RateLimitExceededError, TransientQueryError
 from .bq_metrics import MetricsCollector, QueryMetrics
 from .config import settings
 
+if TYPE_CHECKING:
+    from google.cloud import bigquery
+
+
+def __getattr__(name: str):
+    # google.cloud.bigquery dominates import time, so it is imported on first
+    # use; keep src.bq.bigquery resolvable for callers and patch targets
+    if name == "bigquery":
+        from google.cloud import bigquery
+
+        return bigquery
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Feature flag configuration with environment variables
 def _get_env_bool(key: str, default: bool) -> bool:
@@ -58,6 +73,7 @@ BREAKER_FAILURES = _get_env_int("LGDA_BQ_BREAKER_FAILURES", 5)
 BREAKER_WINDOW_SEC = _get_env_int("LGDA_BQ_BREAKER_WINDOW_SEC", 60)
 BREAKER_COOLDOWN_SEC = _get_env_int("LGDA_BQ_BREAKER_COOLDOWN_SEC", 20)
 METRICS_ENABLED = _get_env_bool("LGDA_BQ_METRICS_ENABLED", True)
+COALESCE_ENABLED = _get_env_bool("LGDA_BQ_COALESCE_ENABLED", False)
 
 
 class CircuitBreaker:
@@ -189,6 +205,8 @@ def bq_client() -> bigquery.Client:
     if _bq_client is None:
         with _client_lock:
             if _bq_client is None:  # Check again inside the lock
+                from google.cloud import bigquery
+
                 try:
                     creds, project = _resolve_bq_credentials()
                     # Try to create client with current configuration
@@ -232,6 +250,12 @@ ORDER BY table_name, ordinal_position
 ).format(settings.dataset_id)
 
 
+# Precomputed exponential delays (ms) for the configured base and attempt count
+_BACKOFF_LADDER_MS = tuple(
+    (2**attempt) * RETRY_BASE_DELAY_MS for attempt in range(RETRY_MAX_ATTEMPTS)
+)
+
+
 def _calculate_backoff_delay(
     attempt: int,
     base_delay_ms: int = RETRY_BASE_DELAY_MS,
@@ -243,40 +267,117 @@ def _calculate_backoff_delay(
         random_gen = random
 
     # Exponential backoff: 2^attempt * base_delay
-    exponential_delay = (2**attempt) * base_delay_ms
+    if base_delay_ms == RETRY_BASE_DELAY_MS and attempt < len(_BACKOFF_LADDER_MS):
+        exponential_delay = _BACKOFF_LADDER_MS[attempt]
+    else:
+        exponential_delay = (2**attempt) * base_delay_ms
 
-    # Add jitter to avoid thundering herd
-    jitter = random_gen.randint(0, jitter_ms)
+    # Add jitter to avoid thundering herd; random() is much cheaper than randint()
+    jitter = jitter_ms * random_gen.random()
 
     total_delay_ms = exponential_delay + jitter
     return total_delay_ms / 1000.0  # Convert to seconds
 
 
+# Retry classes for _retry_with_backoff, resolved through the exception MRO
+_TRANSIENT = "transient"
+_RATE_LIMITED = "rate_limited"
+_PERMANENT = "permanent"
+
+_RETRY_KINDS: Dict[type, str] = {
+    ServerError: _TRANSIENT,
+    RetryError: _TRANSIENT,
+    TooManyRequests: _RATE_LIMITED,
+    BadRequest: _PERMANENT,
+    Forbidden: _PERMANENT,
+    NotFound: _PERMANENT,
+}
+
+
+@lru_cache(maxsize=64)
+def _retry_kind_for_type(error_class: type) -> Optional[str]:
+    for error_type in error_class.__mro__:
+        kind = _RETRY_KINDS.get(error_type)
+        if kind is not None:
+            return kind
+    return None
+
+
+def _retry_kind(error: Exception) -> Optional[str]:
+    """Return the retry class of ``error``, or None for unclassified errors."""
+    return _retry_kind_for_type(type(error))
+
+
 def _is_transient_error(error: Exception) -> bool:
     """Check if error is transient and should be retried."""
-    return isinstance(error, (ServerError, RetryError))
+    return _retry_kind(error) == _TRANSIENT
 
 
 def _is_rate_limit_error(error: Exception) -> bool:
     """Check if error is a rate limit error."""
-    return isinstance(error, TooManyRequests)
+    return _retry_kind(error) == _RATE_LIMITED
 
 
 def _is_permanent_error(error: Exception) -> bool:
     """Check if error is permanent and should not be retried."""
-    return isinstance(error, (BadRequest, Forbidden, NotFound))
+    return _retry_kind(error) == _PERMANENT
+
+
+class _ErrorPolicy(NamedTuple):
+    """How a query error affects the circuit breaker, retries and the caller."""
+
+    record_failure: bool
+    count_retry: bool
+    translate: Optional[Callable[[Exception], Exception]] = None
+
+
+def _translate_unexpected_error(error: Exception) -> Exception:
+    """Wrap errors without a dedicated policy, surfacing timeouts explicitly."""
+    if "timeout" in str(error).lower():
+        return QueryTimeoutError(f"Query timeout: {error}")
+    return Exception(f"BigQuery execution failed: {error}")
+
+
+# Query error policies, resolved through the exception MRO so subclasses
+# (e.g. InternalServerError -> ServerError) use their closest registered base
+_ERROR_POLICIES: Dict[type, _ErrorPolicy] = {
+    # SQL syntax or validation errors - don't retry
+    BadRequest: _ErrorPolicy(True, False, lambda e: ValueError(f"BigQuery error: {e}")),
+    # Auth/permission and not found errors - not a circuit breaker failure
+    Forbidden: _ErrorPolicy(False, False),
+    NotFound: _ErrorPolicy(False, False),
+    # Rate limit and server errors - retry with backoff
+    TooManyRequests: _ErrorPolicy(True, True),
+    ServerError: _ErrorPolicy(True, True),
+    RetryError: _ErrorPolicy(True, True),
+    # Timeout errors - don't retry but count as failure
+    QueryTimeoutError: _ErrorPolicy(True, False),
+    # Catch-all for other errors
+    Exception: _ErrorPolicy(True, False, _translate_unexpected_error),
+}
+
+
+@lru_cache(maxsize=64)
+def _error_policy_for_type(error_class: type) -> _ErrorPolicy:
+    for error_type in error_class.__mro__:
+        policy = _ERROR_POLICIES.get(error_type)
+        if policy is not None:
+            return policy
+    return _ERROR_POLICIES[Exception]
+
+
+def _error_policy(error: Exception) -> _ErrorPolicy:
+    """Look up the handling policy for a query error (memoized per type)."""
+    return _error_policy_for_type(type(error))
 
 
 def _get_retry_after(error: Exception) -> Optional[int]:
     """Extract Retry-After header value from rate limit error."""
-    if hasattr(error, "response") and error.response:
-        retry_after = error.response.headers.get("Retry-After")
-        if retry_after:
-            try:
-                return int(retry_after)
-            except ValueError:
-                pass
-    return None
+    # EAFP: missing response/headers/header and malformed values all mean "none"
+    try:
+        return int(error.response.headers["Retry-After"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
 
 
 def _retry_with_backoff(
@@ -291,24 +392,32 @@ def _retry_with_backoff(
         return func(*args, **kwargs)
 
     last_exception = None
+    # Bind loop-invariant globals/attributes to locals for the retry loop;
+    # resolved per call so patched time.sleep / logging still take effect
+    retry_kind = _retry_kind
+    backoff_delay = _calculate_backoff_delay
+    sleep = time.sleep
+    warn = logging.warning
+    last_attempt = max_attempts - 1
 
     for attempt in range(max_attempts):
         try:
             return func(*args, **kwargs)
         except Exception as e:
             last_exception = e
+            kind = retry_kind(e)
 
             # Don't retry permanent errors
-            if _is_permanent_error(e):
+            if kind == _PERMANENT:
                 raise e
 
             # For the last attempt, raise the exception
-            if attempt == max_attempts - 1:
-                if _is_transient_error(e):
+            if attempt == last_attempt:
+                if kind == _TRANSIENT:
                     raise TransientQueryError(
                         f"Query failed after {max_attempts} attempts: {e}", e
                     )
-                elif _is_rate_limit_error(e):
+                elif kind == _RATE_LIMITED:
                     retry_after = _get_retry_after(e)
                     raise RateLimitExceededError(
                         f"Rate limit exceeded: {e}", retry_after
@@ -317,34 +426,45 @@ def _retry_with_backoff(
                     raise e
 
             # Calculate delay
-            if _is_rate_limit_error(e):
+            if kind == _RATE_LIMITED:
                 # Respect Retry-After header if present
                 retry_after = _get_retry_after(e)
                 if retry_after:
                     delay = retry_after
                 else:
-                    delay = _calculate_backoff_delay(
+                    delay = backoff_delay(
                         attempt, 1000, 500, random_gen
                     )  # Longer delay for rate limits
             else:
-                delay = _calculate_backoff_delay(attempt, random_gen=random_gen)
-
-            logging.warning(
-                f"Attempt {attempt + 1} failed with {type(e).__name__}: {e}. Retrying in {delay:.2f}s"
+                delay = backoff_delay(attempt, random_gen=random_gen)
+
+            # Lazy %-formatting: str(e) is only rendered if WARNING is enabled
+            warn(
+                "Attempt %d failed with %s: %s. Retrying in %.2fs",
+                attempt + 1,
+                type(e).__name__,
+                e,
+                delay,
             )
-            time.sleep(delay)
+            sleep(delay)
 
     # This should not be reached, but just in case
     raise last_exception or Exception("Retry logic failed unexpectedly")
 
 
 def get_schema(tables: List[str]) -> List[Dict]:
+    from google.cloud import bigquery
+
     client = bq_client()
     job_config = bigquery.QueryJobConfig(
         query_parameters=[bigquery.ArrayQueryParameter("tables", "STRING", tables)],
         maximum_bytes_billed=settings.max_bytes_billed,
     )
     rows = client.query(SCHEMA_QUERY, job_config=job_config).result()
+    # Convert via Arrow so row -> dict happens in C rather than per Row object
+    if hasattr(rows, "to_arrow"):
+        return rows.to_arrow().to_pylist()
+    # For testing with mocks that return plain rows
     return [dict(r) for r in rows]
 
 
@@ -379,16 +499,73 @@ def _store_query_metrics(metrics: QueryMetrics) -> None:
     _last_query_metrics = metrics
 
 
+def _query_job_config(timeout: int, dry_run: bool = False) -> bigquery.QueryJobConfig:
+    """Build the job configuration shared by all query execution paths."""
+    from google.cloud import bigquery
+
+    return bigquery.QueryJobConfig(
+        maximum_bytes_billed=settings.max_bytes_billed,
+        dry_run=dry_run,
+        use_query_cache=True,
+        job_timeout_ms=timeout * 1000,  # Convert to milliseconds
+    )
+
+
+# Plain NumPy dtypes for to_dataframe (opt-in via nullable_dtypes=False); skips
+# the per-column nullable dtype conversion that dominates materialization time
+_PLAIN_DTYPE_KWARGS = {
+    "bool_dtype": None,
+    "int_dtype": None,
+    "date_dtype": None,
+    "time_dtype": None,
+}
+
+
+class _InFlightQuery:
+    """A query being executed by one caller, shared with identical callers."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self) -> None:
+        self.future: Future = Future()
+        self.waiters = 0
+
+
+# In-flight queries keyed by (sql, dry_run, nullable_dtypes, timeout); identical concurrent
+# calls wait on the first caller's future instead of submitting duplicate BigQuery jobs.
+# The timeout is part of the key so no caller waits on a job with a longer deadline.
+_in_flight_queries: Dict[tuple, _InFlightQuery] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _copy_result(result: Optional[object]) -> Optional[object]:
+    """Private copy of a shared query result (DataFrames are mutable)."""
+    copy = getattr(result, "copy", None)
+    return copy() if copy is not None else result
+
+
 def run_query(
-    sql: str, dry_run: bool = False, timeout: Optional[int] = None
+    sql: str,
+    dry_run: bool = False,
+    timeout: Optional[int] = None,
+    nullable_dtypes: bool = True,
 ) -> Optional[object]:
     """
     Execute BigQuery SQL with comprehensive error handling, retry logic, and circuit breaker.
 
+    With LGDA_BQ_COALESCE_ENABLED=true, concurrent calls with identical
+    arguments share a single BigQuery job: the first caller executes it and
+    every caller gets its own copy of the resulting DataFrame. Waiters re-raise
+    the executing caller's exception instance.
+
     Args:
         sql: SQL query to execute
         dry_run: If True, validate query without execution
         timeout: Query timeout in seconds (default: from env LGDA_BQ_TIMEOUT_SEC)
+        nullable_dtypes: If False, skip the conversion to pandas nullable
+            extension dtypes (Int64, boolean, dbdate, ...) and return plain
+            NumPy/object dtypes. Faster, but INT64 columns with NULLs become
+            float64 and lose precision above 2**53
 
     Returns:
         pandas.DataFrame with query results or None for dry_run
@@ -402,6 +579,48 @@ def run_query(
         TransientQueryError: For transient errors after retries
         Exception: For other BigQuery errors
     """
+    if not COALESCE_ENABLED:
+        return _execute_query(sql, dry_run, timeout, nullable_dtypes)
+
+    timeout = timeout or TIMEOUT_SEC
+    key = (sql, dry_run, nullable_dtypes, timeout)
+    with _in_flight_lock:
+        in_flight = _in_flight_queries.get(key)
+        if in_flight is None:
+            in_flight = _in_flight_queries[key] = _InFlightQuery()
+            leader = True
+        else:
+            in_flight.waiters += 1
+            leader = False
+
+    if not leader:
+        try:
+            return _copy_result(in_flight.future.result(timeout=timeout))
+        except FutureTimeoutError:
+            raise QueryTimeoutError(
+                f"Query timeout after {timeout}s waiting for identical in-flight query"
+            )
+
+    try:
+        result = _execute_query(sql, dry_run, timeout, nullable_dtypes)
+    except BaseException as e:
+        in_flight.future.set_exception(e)
+        raise
+    else:
+        in_flight.future.set_result(result)
+    finally:
+        with _in_flight_lock:
+            _in_flight_queries.pop(key, None)
+
+    # Waiters copy from the future's result, so the executing caller may only
+    # keep the original when nobody joined
+    return _copy_result(result) if in_flight.waiters else result
+
+
+def _execute_query(
+    sql: str, dry_run: bool, timeout: Optional[int], nullable_dtypes: bool
+) -> Optional[object]:
+    """Run a single query with retries, timeout handling and circuit breaker."""
     # Check circuit breaker
     if not _circuit_breaker.can_execute():
         raise TransientQueryError("Circuit breaker is open - too many recent failures")
@@ -417,12 +636,7 @@ def run_query(
         nonlocal retry_count
 
         client = bq_client()
-        job_config = bigquery.QueryJobConfig(
-            maximum_bytes_billed=settings.max_bytes_billed,
-            dry_run=dry_run,
-            use_query_cache=True,
-            job_timeout_ms=effective_timeout * 1000,  # Convert to milliseconds
-        )
+        job_config = _query_job_config(effective_timeout, dry_run=dry_run)
 
         try:
             job = client.query(sql, job_config=job_config)
@@ -481,39 +695,24 @@ def run_query(
 
             # Convert to DataFrame with BigQuery Storage for large results
             if hasattr(result, "to_dataframe"):
-                return result.to_dataframe(create_bqstorage_client=True)
+                if nullable_dtypes:
+                    return result.to_dataframe(create_bqstorage_client=True)
+                return result.to_dataframe(
+                    create_bqstorage_client=True, **_PLAIN_DTYPE_KWARGS
+                )
             else:
                 # For testing with mocks that don't have to_dataframe
                 return result
 
-        except BadRequest as e:
-            # SQL syntax or validation errors - don't retry
-            _circuit_breaker.record_failure()
-            raise ValueError(f"BigQuery error: {e}")
-        except (Forbidden, NotFound) as e:
-            # Auth/permission and not found errors - don't retry but don't count as circuit breaker failure
-            raise e
-        except TooManyRequests as e:
-            # Rate limit errors - retry with backoff
-            _circuit_breaker.record_failure()
-            retry_count += 1
-            raise e
-        except (ServerError, RetryError) as e:
-            # Server errors - retry with exponential backoff
-            _circuit_breaker.record_failure()
-            retry_count += 1
-            raise e
-        except QueryTimeoutError as e:
-            # Timeout errors - don't retry but count as failure
-            _circuit_breaker.record_failure()
-            raise e
         except Exception as e:
-            # Catch-all for other errors
-            _circuit_breaker.record_failure()
-            if "timeout" in str(e).lower():
-                raise QueryTimeoutError(f"Query timeout: {e}")
-            # For testing, don't transform generic exceptions into TransientQueryError if they're not actually transient
-            raise Exception(f"BigQuery execution failed: {e}")
+            policy = _error_policy(e)
+            if policy.record_failure:
+                _circuit_breaker.record_failure()
+            if policy.count_retry:
+                retry_count += 1
+            if policy.translate is not None:
+                raise policy.translate(e)
+            raise
 
     try:
         return _retry_with_backoff(_execute_query_attempt)
@@ -522,3 +721,68 @@ def run_query(
         if not isinstance(e, (ValueError, Forbidden, NotFound)):
             _circuit_breaker.record_failure()
         raise e
+
+
+def run_query_stream(
+    sql: str, timeout: Optional[int] = None, bqstorage_client: Optional[object] = None
+) -> Iterator[object]:
+    """
+    Execute BigQuery SQL and stream results as Arrow record batches.
+
+    Unlike run_query, the result set is never materialized as a whole: batches
+    are fetched page by page (or via the BigQuery Storage API when a
+    bqstorage_client is given), so memory stays bounded for large results.
+    The circuit breaker records success only once every batch has been read,
+    and errors raised while reading count as failures.
+
+    run_query does not build on this path: it keeps to_dataframe for its
+    dtype handling (nullable_dtypes), dry runs and per-query metrics.
+
+    Args:
+        sql: SQL query to execute
+        timeout: Query timeout in seconds (default: from env LGDA_BQ_TIMEOUT_SEC)
+        bqstorage_client: Optional BigQuery Storage read client for faster downloads
+
+    Returns:
+        Iterator of pyarrow.RecordBatch
+
+    Raises:
+        ValueError: For SQL syntax errors
+        Forbidden: For authentication/permission errors
+        NotFound: For missing tables/datasets
+        TransientQueryError: For transient errors after retries
+    """
+    if not _circuit_breaker.can_execute():
+        raise TransientQueryError("Circuit breaker is open - too many recent failures")
+
+    effective_timeout = timeout or TIMEOUT_SEC
+
+    def _wait_for_result():
+        try:
+            client = bq_client()
+            job = client.query(sql, job_config=_query_job_config(effective_timeout))
+            return job.result(timeout=effective_timeout)
+        except Exception as e:
+            policy = _error_policy(e)
+            if policy.record_failure:
+                _circuit_breaker.record_failure()
+            if policy.translate is not None:
+                raise policy.translate(e)
+            raise
+
+    result = _retry_with_backoff(_wait_for_result)
+    return _consume_batches(result.to_arrow_iterable(bqstorage_client=bqstorage_client))
+
+
+def _consume_batches(batches: Iterator[object]) -> Iterator[object]:
+    """Yield streamed batches, reporting the outcome to the circuit breaker."""
+    try:
+        yield from batches
+    except Exception as e:
+        policy = _error_policy(e)
+        if policy.record_failure:
+            _circuit_breaker.record_failure()
+        if policy.translate is not None:
+            raise policy.translate(e)
+        raise
+    _circuit_breaker.record_success()
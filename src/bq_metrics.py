@@ -8,8 +8,11 @@ import time
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, Optional
 
+# Value types that json.dumps serializes natively
+_JSON_SCALAR_TYPES = (str, int, float, bool)
 
-@dataclass
+
+@dataclass(slots=True)
 class QueryMetrics:
     """Enhanced metrics for BigQuery query execution monitoring."""
 
@@ -40,16 +43,11 @@ class QueryMetrics:
         }
 
         # Remove None values and convert Mock objects to strings for cleaner logs
-        clean_log_data = {}
-        for k, v in log_data.items():
-            if v is not None:
-                # Handle Mock objects and other non-serializable types
-                try:
-                    json.dumps(v)  # Test if it's JSON serializable
-                    clean_log_data[k] = v
-                except (TypeError, ValueError):
-                    # Convert non-serializable objects to string representation
-                    clean_log_data[k] = str(v)
+        clean_log_data = {
+            k: v if isinstance(v, _JSON_SCALAR_TYPES) else str(v)
+            for k, v in log_data.items()
+            if v is not None
+        }
 
         logging.log(level, "BigQuery query metrics: %s", json.dumps(clean_log_data))
 
@@ -2,35 +2,64 @@ import base64
 import builtins as _builtins
 import json
 import os
+import re
 import warnings
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Union
 
-from pydantic import AliasChoices, Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+if TYPE_CHECKING:
+    from .config_lgda import LGDAConfig
+
+
+def _preserve_original(cls):
+    """Keep the first definition of ``cls`` across module reloads.
+
+    Tests reload this module; factories resolve ``<Name>_ORIGINAL`` so
+    ``isinstance`` checks keep working. With LGDA_TEST_RELOAD_SHIM set, the
+    class is also published into builtins.
+    """
+    original = globals().setdefault(f"{cls.__name__}_ORIGINAL", cls)
+    if os.environ.get("LGDA_TEST_RELOAD_SHIM") and not hasattr(_builtins, cls.__name__):
+        setattr(_builtins, cls.__name__, original)
+    return original
 
 
 # Import unified configuration - delay to avoid circular imports
+_unified_config_getter: Optional[Callable[[], Any]] = None
+
+
 def _get_unified_config():
-    """Late import to avoid circular dependencies."""
-    from .configuration import get_unified_config
+    """Late import to avoid circular dependencies; resolved on first call."""
+    global _unified_config_getter
+    if _unified_config_getter is None:
+        from .configuration import get_unified_config
 
-    return get_unified_config()
+        _unified_config_getter = get_unified_config
+    return _unified_config_getter()
 
 
-try:
-    # Auto-load .env early (dev convenience). Safe if not present.
-    from dotenv import load_dotenv  # type: ignore
+# Auto-load .env early (dev convenience). Safe if not present. The sentinel lives in
+# os.environ so reloads and re-imports skip the file scan; production deployments
+# are expected to provide their environment explicitly.
+if (
+    not os.environ.get("_LGDA_DOTENV_LOADED")
+    and os.environ.get("LGDA_ENVIRONMENT") != "production"
+):
+    try:
+        from dotenv import load_dotenv  # type: ignore
 
-    load_dotenv()
-except ImportError:
-    pass
+        load_dotenv()
+        os.environ["_LGDA_DOTENV_LOADED"] = "1"
+    except ImportError:
+        pass
 
 
 # Legacy Settings class for backward compatibility
-@dataclass
+@dataclass(slots=True)
 class Settings:
 
     google_api_key: str = field(default="")
@@ -47,246 +76,103 @@ class Settings:
 
     def __post_init__(self) -> None:
         # Read dynamically from environment (supports tests using patch.dict)
-        self.google_api_key = os.getenv("GOOGLE_API_KEY", "")
-        self.bq_project = os.getenv("BIGQUERY_PROJECT", "")
-        self.bq_location = os.getenv("BIGQUERY_LOCATION", "US")
-        self.dataset_id = os.getenv(
-            "DATASET_ID", "bigquery-public-data.thelook_ecommerce"
-        )
+        (
+            self.google_api_key,
+            self.bq_project,
+            self.bq_location,
+            self.dataset_id,
+            self.allowed_tables,
+            self.max_bytes_billed,
+            self.model_name,
+            self.aws_region,
+            self.bedrock_model_id,
+        ) = _parse_settings_env(_settings_env_snapshot())
 
-        if "ALLOWED_TABLES" in os.environ:
-            raw = os.getenv("ALLOWED_TABLES", "")
-            self.allowed_tables = tuple(t.strip() for t in raw.split(","))
-        else:
-            self.allowed_tables = ("orders", "order_items", "products", "users")
 
-        max_bytes_str = os.getenv("MAX_BYTES_BILLED", "100000000")
-        try:
-            self.max_bytes_billed = int(max_bytes_str)
-        except ValueError as e:
-            # Surface invalid configuration as ValueError (tests expect this)
-            raise ValueError("MAX_BYTES_BILLED must be an integer") from e
+# Environment variables that feed Settings, in field order, with their defaults
+_SETTINGS_ENV_DEFAULTS = (
+    ("GOOGLE_API_KEY", ""),
+    ("BIGQUERY_PROJECT", ""),
+    ("BIGQUERY_LOCATION", "US"),
+    ("DATASET_ID", "bigquery-public-data.thelook_ecommerce"),
+    ("ALLOWED_TABLES", None),
+    ("MAX_BYTES_BILLED", "100000000"),
+    ("MODEL_NAME", "gemini-1.5-pro"),
+    ("AWS_REGION", "eu-west-1"),
+    ("BEDROCK_MODEL_ID", ""),
+)
 
-        self.model_name = os.getenv("MODEL_NAME", "gemini-1.5-pro")
-        self.aws_region = os.getenv("AWS_REGION", "eu-west-1")
-        self.bedrock_model_id = os.getenv("BEDROCK_MODEL_ID", "")
 
+def _settings_env_snapshot() -> tuple:
+    env = os.environ
+    return tuple(env.get(key, default) for key, default in _SETTINGS_ENV_DEFAULTS)
 
-# New LGDA Configuration using Pydantic BaseSettings
-class LGDAConfig(BaseSettings):
-    """
-    Main LGDA configuration using Pydantic BaseSettings.
-    Supports both legacy and LGDA_* prefixed environment variables.
-    """
 
-    # Environment identification
-    environment: str = Field(default="development", validation_alias="LGDA_ENVIRONMENT")
-    debug: bool = Field(default=False, validation_alias="LGDA_DEBUG")
-    log_level: str = Field(default="INFO", validation_alias="LGDA_LOG_LEVEL")
+@lru_cache(maxsize=8)
+def _parse_settings_env(snapshot: tuple) -> tuple:
+    """Parse a Settings env snapshot into field values (cached per snapshot)."""
+    raw_tables = snapshot[4]
+    if raw_tables is not None:
+        allowed_tables = tuple(t.strip() for t in raw_tables.split(","))
+    else:
+        allowed_tables = ("orders", "order_items", "products", "users")
 
-    # BigQuery configuration
-    bigquery_project_id: str = Field(
-        default="", validation_alias="LGDA_BIGQUERY_PROJECT_ID"
-    )
-    bigquery_dataset: str = Field(
-        default="bigquery-public-data.thelook_ecommerce",
-        validation_alias="LGDA_BIGQUERY_DATASET",
-    )
-    bigquery_location: str = Field(
-        default="US", validation_alias="LGDA_BIGQUERY_LOCATION"
-    )
-    bigquery_credentials_path: Optional[str] = Field(
-        default=None, validation_alias="LGDA_BIGQUERY_CREDENTIALS"
-    )
+    try:
+        max_bytes_billed = int(snapshot[5])
+    except ValueError as e:
+        # Surface invalid configuration as ValueError (tests expect this)
+        raise ValueError("MAX_BYTES_BILLED must be an integer") from e
 
-    # LLM configuration
-    llm_primary_provider: str = Field(
-        default="gemini", validation_alias="LGDA_LLM_PRIMARY"
-    )
-    llm_fallback_provider: str = Field(
-        default="bedrock", validation_alias="LGDA_LLM_FALLBACK"
-    )
-    gemini_api_key: Optional[str] = Field(
-        default=None, validation_alias="LGDA_GEMINI_API_KEY"
-    )
-    gemini_project_id: Optional[str] = Field(
-        default=None, validation_alias="LGDA_GEMINI_PROJECT_ID"
-    )
-    bedrock_region: str = Field(
-        default="us-east-1", validation_alias="LGDA_BEDROCK_REGION"
-    )
+    return (*snapshot[:4], allowed_tables, max_bytes_billed, *snapshot[6:])
 
-    # Security policies
-    sql_max_limit: int = Field(default=1000, validation_alias="LGDA_SQL_MAX_LIMIT")
-    allowed_tables: List[str] = Field(
-        default_factory=lambda: ["orders", "order_items", "products", "users"],
-        validation_alias=AliasChoices("LGDA_ALLOWED_TABLES", "ALLOWED_TABLES"),
-    )
 
-    # Error handling policies
-    strict_no_fake_report: bool = Field(
-        default=True, validation_alias="LGDA_STRICT_NO_FAKE_REPORT"
-    )
+@lru_cache(maxsize=1)
+def _build_settings(env_fingerprint: tuple) -> Settings:
+    return Settings()
 
-    # Observability configuration
-    observability_enabled: bool = Field(
-        default=True, validation_alias="LGDA_OBSERVABILITY_ENABLED"
-    )
-    disable_observability: bool = Field(
-        default=False, validation_alias="LGDA_DISABLE_OBSERVABILITY"
-    )
-    metrics_enabled: bool = Field(default=True, validation_alias="LGDA_METRICS_ENABLED")
-    logging_enabled: bool = Field(default=True, validation_alias="LGDA_LOGGING_ENABLED")
-    tracing_enabled: bool = Field(default=True, validation_alias="LGDA_TRACING_ENABLED")
-    health_monitoring_enabled: bool = Field(
-        default=True, validation_alias="LGDA_HEALTH_MONITORING_ENABLED"
-    )
-    business_metrics_enabled: bool = Field(
-        default=True, validation_alias="LGDA_BUSINESS_METRICS_ENABLED"
-    )
-
-    # Observability endpoints and configuration
-    prometheus_endpoint: Optional[str] = Field(
-        default=None, validation_alias="LGDA_PROMETHEUS_ENDPOINT"
-    )
-    jaeger_endpoint: Optional[str] = Field(
-        default=None, validation_alias="LGDA_JAEGER_ENDPOINT"
-    )
-    health_check_interval: int = Field(
-        default=30, validation_alias="LGDA_HEALTH_CHECK_INTERVAL"
-    )
-    metrics_retention_hours: int = Field(
-        default=24, validation_alias="LGDA_METRICS_RETENTION_HOURS"
-    )
 
-    def __init__(self, **kwargs):
-        # Handle legacy environment variable mapping with warnings FIRST
-        self._handle_legacy_env_vars()
+def get_settings() -> Settings:
+    """Return a shared Settings instance, rebuilt only when its env vars change."""
+    return _build_settings(_settings_env_snapshot())
 
-        super().__init__(**kwargs)
-
-    @field_validator("environment")
-    @classmethod
-    def validate_environment(cls, v):
-        allowed = ["development", "staging", "production"]
-        if v not in allowed:
-            raise ValueError(f"environment must be one of {allowed}")
-        return v
 
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v):
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v not in allowed:
-            raise ValueError(f"log_level must be one of {allowed}")
-        return v
+# New LGDA Configuration using Pydantic BaseSettings, imported on first use
+def _load_lgda_config():
+    """Import LGDAConfig (and pydantic) and publish it on this module."""
+    from .config_lgda import LGDAConfig
 
-    @field_validator("allowed_tables", mode="before")
-    @classmethod
-    def parse_allowed_tables(cls, v):
-        """Allow comma-separated string or JSON array for allowed_tables."""
-        if v is None or v == "":
-            return ["orders", "order_items", "products", "users"]
-        if isinstance(v, list):
-            return v
-        if isinstance(v, tuple):
-            return list(v)
-        if isinstance(v, str):
-            # Try JSON first
-            try:
-                parsed = json.loads(v)
-                if isinstance(parsed, list):
-                    return [str(item) for item in parsed]
-            except (json.JSONDecodeError, TypeError, ValueError):
-                # Fallback to comma-separated parsing
-                return [t.strip() for t in v.split(",") if t.strip()]
-        raise ValueError("allowed_tables must be a list or comma-separated string")
-
-    @property
-    def is_observability_enabled(self) -> bool:
-        """Check if observability is enabled overall."""
-        # Use getattr to safely get disable_observability since it might be extra field
-        disable_flag = getattr(self, "disable_observability", False)
-        return self.observability_enabled and not disable_flag
-
-    @property
-    def effective_observability_config(self) -> Dict[str, bool]:
-        """Get effective observability configuration."""
-        base_enabled = self.is_observability_enabled
-        return {
-            "metrics": base_enabled and getattr(self, "metrics_enabled", True),
-            "logging": base_enabled and getattr(self, "logging_enabled", True),
-            "tracing": base_enabled and getattr(self, "tracing_enabled", True),
-            "health_monitoring": base_enabled
-            and getattr(self, "health_monitoring_enabled", True),
-            "business_metrics": base_enabled
-            and getattr(self, "business_metrics_enabled", True),
-        }
+    globals()["LGDAConfig"] = LGDAConfig
+    return _preserve_original(LGDAConfig)
 
-    # (second __init__ removed; logic consolidated above)
-
-    def _handle_legacy_env_vars(self):
-        """Handle legacy environment variables with soft warnings."""
-        legacy_mappings = {
-            "GOOGLE_API_KEY": "LGDA_GEMINI_API_KEY",
-            "BIGQUERY_PROJECT": "LGDA_BIGQUERY_PROJECT_ID",
-            "BIGQUERY_LOCATION": "LGDA_BIGQUERY_LOCATION",
-            "DATASET_ID": "LGDA_BIGQUERY_DATASET",
-            "MAX_BYTES_BILLED": "LGDA_SQL_MAX_LIMIT",
-            "AWS_REGION": "LGDA_BEDROCK_REGION",
-            "ALLOWED_TABLES": "LGDA_ALLOWED_TABLES",
-        }
 
-        for legacy_var, new_var in legacy_mappings.items():
-            if legacy_var in os.environ and new_var not in os.environ:
-                # Set the new variable from legacy and warn
-                if legacy_var == "ALLOWED_TABLES":
-                    # Convert CSV to JSON list to satisfy pydantic-settings complex decoding
-                    raw = os.environ[legacy_var]
-                    if raw and not raw.strip().startswith("["):
-                        tables = [t.strip() for t in raw.split(",") if t.strip()]
-                        os.environ[new_var] = json.dumps(tables)
-                    else:
-                        os.environ[new_var] = raw
-                else:
-                    os.environ[new_var] = os.environ[legacy_var]
-                warnings.warn(
-                    f"Using legacy environment variable {legacy_var}. "
-                    f"Please migrate to {new_var} for future compatibility.",
-                    DeprecationWarning,
-                    stacklevel=3,
-                )
+def __getattr__(name: str):
+    if name in ("LGDAConfig", "LGDAConfig_ORIGINAL"):
+        _load_lgda_config()
+        return globals()[name]
+    if name == "ENVIRONMENT_PROFILES":
+        return _environment_profiles()
+    if name == "LegacyEnvVarWarning":
+        from .config_lgda import LegacyEnvVarWarning
 
-        # If new-style LGDA_ALLOWED_TABLES is present but CSV, normalize to JSON too
-        if (
-            val := os.environ.get("LGDA_ALLOWED_TABLES")
-        ) and not val.strip().startswith("["):
-            tables = [t.strip() for t in val.split(",") if t.strip()]
-            os.environ["LGDA_ALLOWED_TABLES"] = json.dumps(tables)
-
-    # Pydantic v2 config
-    model_config = SettingsConfigDict(
-        # Do not read .env directly here; tests patch env and expect isolation.
-        env_file=None,
-        case_sensitive=False,
-        env_ignore_empty=True,
-        extra="allow",  # Allow extra fields for extensibility
-    )
+        return LegacyEnvVarWarning
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# Preserve original class identity across reloads for test stability
-if "LGDAConfig_ORIGINAL" not in globals():
-    LGDAConfig_ORIGINAL = LGDAConfig
-    # Also publish canonical references into builtins so `isinstance` survives reloads in tests
-    if not hasattr(_builtins, "LGDAConfig"):
-        setattr(_builtins, "LGDAConfig", LGDAConfig)
+@lru_cache(maxsize=4)
+def _decode_service_account_json(raw: str) -> dict:
+    """Decode base64 service account JSON once per distinct env value."""
+    return json.loads(base64.b64decode(raw))
 
 
 # Credential Manager for secure credential handling
 class CredentialManager:
     """Secure credential management with multiple sources and masking."""
 
-    def __init__(self, config: LGDAConfig):
+    _SENSITIVE_KEY_RE = re.compile(
+        r"api_key|secret|password|token|credentials", re.IGNORECASE
+    )
+
+    def __init__(self, config: "LGDAConfig"):
         self.config = config
         self.secrets_cache = {}
 
@@ -299,7 +185,7 @@ class CredentialManager:
         """
         if creds_json := os.getenv("LGDA_BIGQUERY_CREDENTIALS_JSON"):
             try:
-                return json.loads(base64.b64decode(creds_json))
+                return dict(_decode_service_account_json(creds_json))
             except (json.JSONDecodeError, ValueError) as e:
                 warnings.warn(
                     f"Invalid base64 JSON in LGDA_BIGQUERY_CREDENTIALS_JSON: {e}"
@@ -332,21 +218,13 @@ class CredentialManager:
 
     def mask_sensitive_data(self, data: dict) -> dict:
         """Masks sensitive data for logging."""
-        sensitive_keys = ["api_key", "secret", "password", "token", "credentials"]
-        masked = data.copy()
-        for key in masked:
-            if any(sensitive in key.lower() for sensitive in sensitive_keys):
-                masked[key] = "***MASKED***"
-        return masked
-
+        return {
+            key: "***MASKED***" if self._SENSITIVE_KEY_RE.search(key) else value
+            for key, value in data.items()
+        }
 
-# Expose canonical class into builtins for stable isinstance checks during reloads
-if not hasattr(_builtins, "CredentialManager"):
-    setattr(_builtins, "CredentialManager", CredentialManager)
 
-# Preserve original class identity across reloads for test stability
-if "CredentialManager_ORIGINAL" not in globals():
-    CredentialManager_ORIGINAL = CredentialManager
+_preserve_original(CredentialManager)
 
 
 # Feature Flags
@@ -361,85 +239,107 @@ class FeatureFlag(Enum):
     ENABLE_PERFORMANCE_MONITORING = "enable_performance_monitoring"
 
 
+# Keep one FeatureFlag enum across reloads; flag lookups are keyed by its members
+FeatureFlag = _preserve_original(FeatureFlag)
+
+
 # Environment Profiles
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EnvironmentProfile:
     """Environment-specific configuration overrides."""
 
     name: str
-    config_overrides: Dict[str, Any]
-    feature_flags: Dict[str, bool]
-    performance_settings: Dict[str, Any]
-
-
-# Environment profile definitions
-ENVIRONMENT_PROFILES = {
-    "development": EnvironmentProfile(
-        name="development",
-        config_overrides={
-            "debug": True,
-            "log_level": "DEBUG",
-            "sql_max_limit": 100,  # Smaller limits for dev
-        },
-        feature_flags={
-            "enable_query_cache": False,
-            "enable_cost_tracking": False,
-            "enable_performance_monitoring": False,
-        },
-        performance_settings={
-            "query_timeout": 60,  # 1 minute for dev
-            "retry_count": 1,
-            "cache_ttl": 300,
-        },
-    ),
-    "staging": EnvironmentProfile(
-        name="staging",
-        config_overrides={
-            "debug": False,
-            "log_level": "INFO",
-            "sql_max_limit": 500,
-        },
-        feature_flags={
-            "enable_query_cache": True,
-            "enable_cost_tracking": True,
-            "enable_performance_monitoring": True,
-        },
-        performance_settings={
-            "query_timeout": 180,  # 3 minutes
-            "retry_count": 2,
-            "cache_ttl": 600,
-        },
-    ),
-    "production": EnvironmentProfile(
-        name="production",
-        config_overrides={
-            "debug": False,
-            "log_level": "WARNING",
-            "sql_max_limit": 1000,
-        },
-        feature_flags={
-            "enable_query_cache": True,
-            "enable_cost_tracking": True,
-            "enable_performance_monitoring": True,
-            "enable_fallback_llm": True,
-        },
-        performance_settings={
-            "query_timeout": 300,  # 5 minutes
-            "retry_count": 3,
-            "cache_ttl": 1800,
-        },
-    ),
-}
+    config_overrides: Mapping[str, Any]
+    feature_flags: Mapping[str, bool]
+    performance_settings: Mapping[str, Any]
+
+    def __post_init__(self) -> None:
+        # Profiles are shared process-wide; expose every mapping read-only
+        for name in ("config_overrides", "feature_flags", "performance_settings"):
+            object.__setattr__(self, name, MappingProxyType(dict(getattr(self, name))))
+
+
+# Environment profile definitions, built on first use
+@lru_cache(maxsize=1)
+def _environment_profiles() -> Dict[str, EnvironmentProfile]:
+    return {
+        "development": EnvironmentProfile(
+            name="development",
+            config_overrides={
+                "debug": True,
+                "log_level": "DEBUG",
+                "sql_max_limit": 100,  # Smaller limits for dev
+            },
+            feature_flags={
+                "enable_query_cache": False,
+                "enable_cost_tracking": False,
+                "enable_performance_monitoring": False,
+            },
+            performance_settings={
+                "query_timeout": 60,  # 1 minute for dev
+                "retry_count": 1,
+                "cache_ttl": 300,
+            },
+        ),
+        "staging": EnvironmentProfile(
+            name="staging",
+            config_overrides={
+                "debug": False,
+                "log_level": "INFO",
+                "sql_max_limit": 500,
+            },
+            feature_flags={
+                "enable_query_cache": True,
+                "enable_cost_tracking": True,
+                "enable_performance_monitoring": True,
+            },
+            performance_settings={
+                "query_timeout": 180,  # 3 minutes
+                "retry_count": 2,
+                "cache_ttl": 600,
+            },
+        ),
+        "production": EnvironmentProfile(
+            name="production",
+            config_overrides={
+                "debug": False,
+                "log_level": "WARNING",
+                "sql_max_limit": 1000,
+            },
+            feature_flags={
+                "enable_query_cache": True,
+                "enable_cost_tracking": True,
+                "enable_performance_monitoring": True,
+                "enable_fallback_llm": True,
+            },
+            performance_settings={
+                "query_timeout": 300,  # 5 minutes
+                "retry_count": 3,
+                "cache_ttl": 1800,
+            },
+        ),
+    }
+
+
+def get_profile(environment: str) -> EnvironmentProfile:
+    """Return the profile for an environment name (KeyError if unknown)."""
+    return _environment_profiles()[environment]
 
 
 # Feature Flag Manager
 class FeatureFlagManager:
     """Runtime feature flag evaluation."""
 
-    def __init__(self, config: LGDAConfig, profile: EnvironmentProfile):
+    def __init__(self, config: "LGDAConfig", profile: EnvironmentProfile):
         self.config = config
         self.profile = profile
         self.custom_rules = {}
+        # Resolve profile flags to enum keys once so lookups skip `.value`
+        self._flag_lookup = {
+            FeatureFlag(name): enabled
+            for name, enabled in profile.feature_flags.items()
+            if name in FeatureFlag._value2member_map_
+        }
 
     def is_enabled(self, flag: FeatureFlag, context: dict = None) -> bool:
         """
@@ -449,27 +349,21 @@ class FeatureFlagManager:
         3. Check global config
         4. Default to False
         """
-        if custom_rule := self.custom_rules.get(flag):
+        if self.custom_rules and (custom_rule := self.custom_rules.get(flag)):
             return custom_rule(context or {})
 
-        return self.profile.feature_flags.get(flag.value, False)
+        return self._flag_lookup.get(flag, False)
 
     def add_custom_rule(self, flag: FeatureFlag, rule: Callable[[dict], bool]):
         """Add custom evaluation rule."""
         self.custom_rules[flag] = rule
 
 
-# Expose into builtins for stable isinstance checks
-if not hasattr(_builtins, "FeatureFlagManager"):
-    setattr(_builtins, "FeatureFlagManager", FeatureFlagManager)
-
-# Preserve original class identity across reloads for test stability
-if "FeatureFlagManager_ORIGINAL" not in globals():
-    FeatureFlagManager_ORIGINAL = FeatureFlagManager
+_preserve_original(FeatureFlagManager)
 
 
 # Performance Configuration
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerformanceConfig:
     """Performance tuning parameters."""
 
@@ -494,8 +388,9 @@ class PerformanceConfig:
     cache_compression: bool = True
 
     @classmethod
+    @lru_cache(maxsize=4)
     def for_environment(cls, environment: str) -> "PerformanceConfig":
-        """Factory method for environment-specific performance config."""
+        """Factory method for environment-specific performance config (cached)."""
         if environment == "development":
             return cls(
                 query_timeout=60,
@@ -514,11 +409,95 @@ class PerformanceConfig:
             return cls()
 
 
-# Preserve original class identity across reloads and expose to builtins for stable isinstance checks
-if "PerformanceConfig_ORIGINAL" not in globals():
-    PerformanceConfig_ORIGINAL = PerformanceConfig
-    if not hasattr(_builtins, "PerformanceConfig"):
-        setattr(_builtins, "PerformanceConfig", PerformanceConfig)
+_preserve_original(PerformanceConfig)
+
+
+@lru_cache(maxsize=4)
+def _build_config(env_key: tuple) -> "LGDAConfig":
+    # Use stable class alias to avoid isinstance mismatches after import reloads in tests
+    ConfigCls = globals().get("LGDAConfig_ORIGINAL") or _load_lgda_config()
+    base_config = ConfigCls()
+    profile = get_profile(base_config.environment)
+
+    # Apply environment overrides in one batch; profile values are trusted
+    # constants, so they skip per-field __setattr__ handling
+    overrides = profile.config_overrides
+    base_config.__dict__.update(overrides)
+    base_config.__pydantic_fields_set__.update(overrides)
+
+    return base_config
+
+
+def _config_env_key() -> tuple:
+    """Snapshot of the environment variables that can affect LGDAConfig."""
+    from .config_lgda import LEGACY_ENV_MAPPINGS
+
+    return tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.startswith("LGDA_") or key in LEGACY_ENV_MAPPINGS
+        )
+    )
+
+
+# Hot LGDAConfig fields readable without pydantic: (field, LGDA var, legacy var, default)
+_FAST_CONFIG_FIELDS = (
+    ("environment", "LGDA_ENVIRONMENT", None, "development"),
+    (
+        "bigquery_project_id",
+        "LGDA_BIGQUERY_PROJECT_ID",
+        "BIGQUERY_PROJECT",
+        "",
+    ),
+    (
+        "bigquery_dataset",
+        "LGDA_BIGQUERY_DATASET",
+        "DATASET_ID",
+        "bigquery-public-data.thelook_ecommerce",
+    ),
+    ("bigquery_location", "LGDA_BIGQUERY_LOCATION", "BIGQUERY_LOCATION", "US"),
+    ("gemini_api_key", "LGDA_GEMINI_API_KEY", "GOOGLE_API_KEY", None),
+)
+
+
+@dataclass(slots=True)
+class LGDAConfigFast:
+    """Unvalidated view of the most used LGDAConfig fields.
+
+    Reads its fields straight from the environment, so scripts that only need
+    project/dataset/API key skip pydantic entirely. Any other attribute is
+    delegated to a full ``ConfigFactory.create_config()`` built on first use.
+    Legacy variable names are honoured but, unlike LGDAConfig, not migrated
+    or warned about.
+    """
+
+    environment: str = "development"
+    bigquery_project_id: str = ""
+    bigquery_dataset: str = "bigquery-public-data.thelook_ecommerce"
+    bigquery_location: str = "US"
+    gemini_api_key: Optional[str] = None
+    _full: Optional["LGDAConfig"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_env(cls) -> "LGDAConfigFast":
+        env = os.environ
+        return cls(
+            **{
+                name: env.get(var) or (legacy and env.get(legacy)) or default
+                for name, var, legacy, default in _FAST_CONFIG_FIELDS
+            }
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes outside the fast path
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._full is None:
+            self._full = ConfigFactory.create_config()
+        return getattr(self._full, name)
 
 
 # Configuration Factory
@@ -526,23 +505,30 @@ class ConfigFactory:
     """Central configuration factory."""
 
     @staticmethod
-    def create_config() -> LGDAConfig:
-        """Creates fully configured LGDA config."""
-        # Use stable class alias to avoid isinstance mismatches after import reloads in tests
-        ConfigCls = globals().get("LGDAConfig_ORIGINAL", LGDAConfig)
-        base_config = ConfigCls()
-        profile = ENVIRONMENT_PROFILES[base_config.environment]
+    def create_config() -> "LGDAConfig":
+        """Creates fully configured LGDA config.
 
-        # Apply environment overrides
-        for key, value in profile.config_overrides.items():
-            setattr(base_config, key, value)
+        Validation runs once per environment snapshot; callers get an
+        unvalidated deep copy of the cached config, so mutating list fields
+        such as ``allowed_tables`` never leaks into later calls. Call
+        ``invalidate()`` to force a rebuild.
+        """
+        return _build_config(_config_env_key()).model_copy(deep=True)
 
-        return base_config
+    @staticmethod
+    def create_fast() -> LGDAConfigFast:
+        """Creates a lightweight config for scripts that skip validation."""
+        return LGDAConfigFast.from_env()
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop cached configs built by ``create_config``."""
+        _build_config.cache_clear()
 
     @staticmethod
-    def create_managers(config: LGDAConfig) -> tuple:
+    def create_managers(config: "LGDAConfig") -> tuple:
         """Creates all configuration managers."""
-        profile = ENVIRONMENT_PROFILES[config.environment]
+        profile = get_profile(config.environment)
         # Use canonical/original classes to ensure stable identity
         CredMgrCls = globals().get("CredentialManager_ORIGINAL", CredentialManager)
         FFMgrCls = globals().get("FeatureFlagManager_ORIGINAL", FeatureFlagManager)
@@ -555,7 +541,7 @@ class ConfigFactory:
 
 
 # Maintain backward compatibility
-settings = Settings()
+settings = get_settings()
 
 
 # Convenience functions for accessing unified config components
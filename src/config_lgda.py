@@ -0,0 +1,247 @@
+"""Pydantic-backed LGDA configuration.
+
+Kept separate from ``src.config`` so that importing the legacy ``settings``
+object does not pay for importing pydantic; ``src.config`` loads this module
+on first access to ``LGDAConfig``.
+"""
+
+import json
+import os
+import warnings
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import AliasChoices, Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class LegacyEnvVarWarning(DeprecationWarning):
+    """Emitted when a legacy (non LGDA_*) environment variable is used."""
+
+
+# Legacy environment variables and the LGDA_* names they migrate to
+LEGACY_ENV_MAPPINGS = {
+    "GOOGLE_API_KEY": "LGDA_GEMINI_API_KEY",
+    "BIGQUERY_PROJECT": "LGDA_BIGQUERY_PROJECT_ID",
+    "BIGQUERY_LOCATION": "LGDA_BIGQUERY_LOCATION",
+    "DATASET_ID": "LGDA_BIGQUERY_DATASET",
+    "MAX_BYTES_BILLED": "LGDA_SQL_MAX_LIMIT",
+    "AWS_REGION": "LGDA_BEDROCK_REGION",
+    "ALLOWED_TABLES": "LGDA_ALLOWED_TABLES",
+}
+
+# Accepted values for validated fields (ordered tuples keep error messages stable)
+_ENVIRONMENTS = ("development", "staging", "production")
+_ALLOWED_ENVIRONMENTS = frozenset(_ENVIRONMENTS)
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_ALLOWED_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+
+@lru_cache(maxsize=32)
+def _parse_tables(raw: str) -> Optional[Tuple[str, ...]]:
+    """Parse a JSON array or comma-separated table list; None for other JSON."""
+    # Try JSON first
+    try:
+        parsed = json.loads(raw)
+    except ValueError:
+        # Fallback to comma-separated parsing
+        return tuple(t.strip() for t in raw.split(",") if t.strip())
+    if isinstance(parsed, list):
+        return tuple(str(item) for item in parsed)
+    return None
+
+
+@lru_cache(maxsize=32)
+def _tables_env_as_json(raw: str) -> str:
+    """Normalize a CSV table list to the JSON form pydantic-settings decodes."""
+    if raw and not raw.strip().startswith("["):
+        return json.dumps([t.strip() for t in raw.split(",") if t.strip()])
+    return raw
+
+
+class LGDAConfig(BaseSettings):
+    """
+    Main LGDA configuration using Pydantic BaseSettings.
+    Supports both legacy and LGDA_* prefixed environment variables.
+    """
+
+    # Environment identification
+    environment: str = Field(default="development", validation_alias="LGDA_ENVIRONMENT")
+    debug: bool = Field(default=False, validation_alias="LGDA_DEBUG")
+    log_level: str = Field(default="INFO", validation_alias="LGDA_LOG_LEVEL")
+
+    # BigQuery configuration
+    bigquery_project_id: str = Field(
+        default="", validation_alias="LGDA_BIGQUERY_PROJECT_ID"
+    )
+    bigquery_dataset: str = Field(
+        default="bigquery-public-data.thelook_ecommerce",
+        validation_alias="LGDA_BIGQUERY_DATASET",
+    )
+    bigquery_location: str = Field(
+        default="US", validation_alias="LGDA_BIGQUERY_LOCATION"
+    )
+    bigquery_credentials_path: Optional[str] = Field(
+        default=None, validation_alias="LGDA_BIGQUERY_CREDENTIALS"
+    )
+
+    # LLM configuration
+    llm_primary_provider: str = Field(
+        default="gemini", validation_alias="LGDA_LLM_PRIMARY"
+    )
+    llm_fallback_provider: str = Field(
+        default="bedrock", validation_alias="LGDA_LLM_FALLBACK"
+    )
+    gemini_api_key: Optional[str] = Field(
+        default=None, validation_alias="LGDA_GEMINI_API_KEY"
+    )
+    gemini_project_id: Optional[str] = Field(
+        default=None, validation_alias="LGDA_GEMINI_PROJECT_ID"
+    )
+    bedrock_region: str = Field(
+        default="us-east-1", validation_alias="LGDA_BEDROCK_REGION"
+    )
+
+    # Security policies
+    sql_max_limit: int = Field(default=1000, validation_alias="LGDA_SQL_MAX_LIMIT")
+    allowed_tables: List[str] = Field(
+        default_factory=lambda: ["orders", "order_items", "products", "users"],
+        validation_alias=AliasChoices("LGDA_ALLOWED_TABLES", "ALLOWED_TABLES"),
+    )
+
+    # Error handling policies
+    strict_no_fake_report: bool = Field(
+        default=True, validation_alias="LGDA_STRICT_NO_FAKE_REPORT"
+    )
+
+    # Observability configuration
+    observability_enabled: bool = Field(
+        default=True, validation_alias="LGDA_OBSERVABILITY_ENABLED"
+    )
+    disable_observability: bool = Field(
+        default=False, validation_alias="LGDA_DISABLE_OBSERVABILITY"
+    )
+    metrics_enabled: bool = Field(default=True, validation_alias="LGDA_METRICS_ENABLED")
+    logging_enabled: bool = Field(default=True, validation_alias="LGDA_LOGGING_ENABLED")
+    tracing_enabled: bool = Field(default=True, validation_alias="LGDA_TRACING_ENABLED")
+    health_monitoring_enabled: bool = Field(
+        default=True, validation_alias="LGDA_HEALTH_MONITORING_ENABLED"
+    )
+    business_metrics_enabled: bool = Field(
+        default=True, validation_alias="LGDA_BUSINESS_METRICS_ENABLED"
+    )
+
+    # Observability endpoints and configuration
+    prometheus_endpoint: Optional[str] = Field(
+        default=None, validation_alias="LGDA_PROMETHEUS_ENDPOINT"
+    )
+    jaeger_endpoint: Optional[str] = Field(
+        default=None, validation_alias="LGDA_JAEGER_ENDPOINT"
+    )
+    health_check_interval: int = Field(
+        default=30, validation_alias="LGDA_HEALTH_CHECK_INTERVAL"
+    )
+    metrics_retention_hours: int = Field(
+        default=24, validation_alias="LGDA_METRICS_RETENTION_HOURS"
+    )
+
+    def __init__(self, **kwargs):
+        # Handle legacy environment variable mapping with warnings FIRST
+        self._handle_legacy_env_vars()
+
+        super().__init__(**kwargs)
+
+    @field_validator("environment")
+    @classmethod
+    def validate_environment(cls, v):
+        if v in _ALLOWED_ENVIRONMENTS:
+            return v
+        raise ValueError(f"environment must be one of {list(_ENVIRONMENTS)}")
+
+    @field_validator("log_level")
+    @classmethod
+    def validate_log_level(cls, v):
+        if v in _ALLOWED_LOG_LEVELS:
+            return v
+        raise ValueError(f"log_level must be one of {list(_LOG_LEVELS)}")
+
+    @field_validator("allowed_tables", mode="before")
+    @classmethod
+    def parse_allowed_tables(cls, v):
+        """Allow comma-separated string or JSON array for allowed_tables."""
+        if v is None or v == "":
+            return ["orders", "order_items", "products", "users"]
+        if isinstance(v, list):
+            return v
+        if isinstance(v, tuple):
+            return list(v)
+        if isinstance(v, str) and (tables := _parse_tables(v)) is not None:
+            return list(tables)
+        raise ValueError("allowed_tables must be a list or comma-separated string")
+
+    @property
+    def is_observability_enabled(self) -> bool:
+        """Check if observability is enabled overall."""
+        # Use getattr to safely get disable_observability since it might be extra field
+        disable_flag = getattr(self, "disable_observability", False)
+        return self.observability_enabled and not disable_flag
+
+    @property
+    def effective_observability_config(self) -> Dict[str, bool]:
+        """Get effective observability configuration."""
+        base_enabled = self.is_observability_enabled
+        return {
+            "metrics": base_enabled and getattr(self, "metrics_enabled", True),
+            "logging": base_enabled and getattr(self, "logging_enabled", True),
+            "tracing": base_enabled and getattr(self, "tracing_enabled", True),
+            "health_monitoring": base_enabled
+            and getattr(self, "health_monitoring_enabled", True),
+            "business_metrics": base_enabled
+            and getattr(self, "business_metrics_enabled", True),
+        }
+
+    # (second __init__ removed; logic consolidated above)
+
+    def _handle_legacy_env_vars(self):
+        """Handle legacy environment variables with soft warnings."""
+        env = os.environ
+        for legacy_var, new_var in LEGACY_ENV_MAPPINGS.items():
+            legacy_val = env.get(legacy_var)
+            if legacy_val is not None and new_var not in env:
+                # Set the new variable from legacy and warn
+                if legacy_var == "ALLOWED_TABLES":
+                    # Convert CSV to JSON list to satisfy pydantic-settings complex decoding
+                    env[new_var] = _tables_env_as_json(legacy_val)
+                else:
+                    env[new_var] = legacy_val
+                warnings.warn(
+                    f"Using legacy environment variable {legacy_var}. "
+                    f"Please migrate to {new_var} for future compatibility.",
+                    LegacyEnvVarWarning,
+                    stacklevel=3,
+                )
+
+        # If new-style LGDA_ALLOWED_TABLES is present but CSV, normalize to JSON too
+        if (val := env.get("LGDA_ALLOWED_TABLES")) and not val.strip().startswith("["):
+            env["LGDA_ALLOWED_TABLES"] = _tables_env_as_json(val)
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings,
+    ):
+        # Only init kwargs and process env are used; skip dotenv/secrets sources
+        return (init_settings, env_settings)
+
+    # Pydantic v2 config
+    model_config = SettingsConfigDict(
+        # Do not read .env directly here; tests patch env and expect isolation.
+        env_file=None,
+        case_sensitive=False,
+        env_ignore_empty=True,
+        extra="allow",  # Allow extra fields for extensibility
+    )
@@ -16,6 +16,7 @@ from .unified import (
     get_performance_config,
     get_security_config,
     get_unified_config,
+    reset_unified_config,
 )
 
 __all__ = [
@@ -29,4 +30,5 @@ __all__ = [
     "get_security_config",
     "get_performance_config",
     "get_unified_config",
+    "reset_unified_config",
 ]
@@ -7,14 +7,58 @@ environment-specific overrides while maintaining backward compatibility.
 
 from __future__ import annotations
 
+import os
+import threading
+from enum import Enum
 from functools import lru_cache
-from typing import List, Optional
+from typing import Callable, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class LLMConfig(BaseSettings):
+class _EnvSettings(BaseSettings):
+    """BaseSettings that only reads init kwargs and process environment.
+
+    None of the component configs use a .env file or secrets directory, so
+    skipping those sources avoids their per-instantiation overhead.
+    """
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings,
+    ):
+        return (init_settings, env_settings)
+
+
+def _context_key(context: str) -> str:
+    # LLMContext members are str enums with lowercase values that hash like
+    # their value, so they can be looked up directly without lower()
+    return context if isinstance(context, Enum) else context.lower()
+
+
+# Field names per LLM context; values are read from the instance on each call
+# so assignments after construction (e.g. environment overrides) take effect
+_MAX_TOKENS_FIELDS = {
+    "planning": "max_tokens_planning",
+    "sql_generation": "max_tokens_sql_generation",
+    "analysis": "max_tokens_analysis",
+    "general": "max_tokens_general",
+}
+_TEMPERATURE_FIELDS = {
+    "planning": "temperature_planning",
+    "sql_generation": "temperature_sql_generation",
+    "analysis": "temperature_analysis",
+    "general": "temperature_general",
+}
+
+
+class LLMConfig(_EnvSettings):
     """Centralized LLM configuration."""
 
     # Token configuration - consolidates scattered max_tokens values
@@ -41,27 +85,17 @@ class LLMConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="LGDA_LLM_", case_sensitive=False)
 
     def get_max_tokens_for_context(self, context: str) -> int:
-        """Get max tokens for specific LLM context."""
-        context_mapping = {
-            "planning": self.max_tokens_planning,
-            "sql_generation": self.max_tokens_sql_generation,
-            "analysis": self.max_tokens_analysis,
-            "general": self.max_tokens_general,
-        }
-        return context_mapping.get(context.lower(), self.max_tokens_general)
+        """Get max tokens for specific LLM context (a name or ``LLMContext``)."""
+        field = _MAX_TOKENS_FIELDS.get(_context_key(context), "max_tokens_general")
+        return getattr(self, field)
 
     def get_temperature_for_context(self, context: str) -> float:
-        """Get temperature for specific LLM context."""
-        context_mapping = {
-            "planning": self.temperature_planning,
-            "sql_generation": self.temperature_sql_generation,
-            "analysis": self.temperature_analysis,
-            "general": self.temperature_general,
-        }
-        return context_mapping.get(context.lower(), self.temperature_general)
+        """Get temperature for specific LLM context (a name or ``LLMContext``)."""
+        field = _TEMPERATURE_FIELDS.get(_context_key(context), "temperature_general")
+        return getattr(self, field)
 
 
-class BigQueryConfig(BaseSettings):
+class BigQueryConfig(_EnvSettings):
     """Centralized BigQuery configuration."""
 
     # Connection settings
@@ -86,7 +120,7 @@ class BigQueryConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="LGDA_BQ_", case_sensitive=False)
 
 
-class SecurityConfig(BaseSettings):
+class SecurityConfig(_EnvSettings):
     """Centralized security configuration."""
 
     # SQL validation settings
@@ -119,7 +153,7 @@ class SecurityConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="LGDA_SECURITY_", case_sensitive=False)
 
 
-class PerformanceConfig(BaseSettings):
+class PerformanceConfig(_EnvSettings):
     """Centralized performance configuration."""
 
     # Memory management
@@ -140,13 +174,44 @@ class PerformanceConfig(BaseSettings):
     )
 
 
+_SettingsT = TypeVar("_SettingsT", bound=_EnvSettings)
+
+
+@lru_cache(maxsize=16)
+def _settings_prototype(cls: Type[_SettingsT], env_key: tuple) -> _SettingsT:
+    return cls()
+
+
+def _shared_settings(cls: Type[_SettingsT]) -> Callable[[], _SettingsT]:
+    """default_factory that validates ``cls`` once per distinct environment.
+
+    Each call returns a deep copy, so callers that adjust a sub-config (as
+    ``create_for_environment`` does) never affect other instances.
+    """
+    prefix = cls.model_config["env_prefix"].upper()
+
+    def factory() -> _SettingsT:
+        env_key = tuple(
+            sorted(
+                (key, value)
+                for key, value in os.environ.items()
+                if key.upper().startswith(prefix)
+            )
+        )
+        return _settings_prototype(cls, env_key).model_copy(deep=True)
+
+    return factory
+
+
 class UnifiedConfig(BaseModel):
     """Unified configuration containing all component configurations."""
 
-    llm: LLMConfig = Field(default_factory=LLMConfig)
-    bigquery: BigQueryConfig = Field(default_factory=BigQueryConfig)
-    security: SecurityConfig = Field(default_factory=SecurityConfig)
-    performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
+    llm: LLMConfig = Field(default_factory=_shared_settings(LLMConfig))
+    bigquery: BigQueryConfig = Field(default_factory=_shared_settings(BigQueryConfig))
+    security: SecurityConfig = Field(default_factory=_shared_settings(SecurityConfig))
+    performance: PerformanceConfig = Field(
+        default_factory=_shared_settings(PerformanceConfig)
+    )
 
     # Environment and debug settings
     environment: str = Field(default="development")
@@ -166,7 +231,22 @@ class UnifiedConfig(BaseModel):
 
     @classmethod
     def create_for_environment(cls, environment: str) -> "UnifiedConfig":
-        """Create configuration optimized for specific environment."""
+        """Create configuration optimized for specific environment.
+
+        The tuned configuration is built once per environment name and
+        process environment; each call returns an independent deep copy.
+        """
+        env_key = tuple(
+            sorted(
+                (key, value)
+                for key, value in os.environ.items()
+                if key.upper().startswith("LGDA_")
+            )
+        )
+        return _environment_config(cls, environment, env_key).model_copy(deep=True)
+
+    @classmethod
+    def _build_for_environment(cls, environment: str) -> "UnifiedConfig":
         config = cls(environment=environment)
 
         if environment == "development":
@@ -190,10 +270,45 @@ class UnifiedConfig(BaseModel):
         return config
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=8)
+def _environment_config(
+    cls: Type[UnifiedConfig], environment: str, env_key: tuple
+) -> UnifiedConfig:
+    return cls._build_for_environment(environment)
+
+
+_unified_config: Optional[UnifiedConfig] = None
+_unified_config_lock = threading.Lock()
+
+
 def get_unified_config() -> UnifiedConfig:
-    """Get cached unified configuration instance."""
-    return UnifiedConfig()
+    """Get cached unified configuration instance.
+
+    Double-checked locking guarantees a single UnifiedConfig (and a single
+    validation pass of its sub-configs) even under concurrent first use.
+    """
+    global _unified_config
+    config = _unified_config
+    if config is None:
+        with _unified_config_lock:
+            config = _unified_config
+            if config is None:
+                config = _unified_config = UnifiedConfig()
+    return config
+
+
+def reset_unified_config() -> None:
+    """Drop the cached unified configuration so the next call rebuilds it.
+
+    Use after changing LGDA_* environment variables at runtime or in tests.
+    """
+    global _unified_config
+    with _unified_config_lock:
+        _unified_config = None
+
+
+# Keep the lru_cache-style reset available to existing callers
+get_unified_config.cache_clear = reset_unified_config  # type: ignore[attr-defined]
 
 
 # Backward compatibility function for existing code
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Union
 
 from .core import LGDAError
@@ -28,76 +29,166 @@ class RecoveryStrategy(Enum):
     NO_RECOVERY = "no_recovery"  # Permanent failure
 
 
+# Lowercase words of which a message must contain at least one for a gapped
+# pattern to match; checked with substring search before running the regex
+_PATTERN_ANCHORS: dict[re.Pattern, tuple[str, ...]] = {}
+
+
+def _compile_gapped(pattern: str) -> re.Pattern:
+    """Compile an alternation of ``word.*word`` branches without backtracking.
+
+    A branch like ``out.*of.*memory`` matches a line iff the first ``out`` on
+    it is followed by ``of`` and then ``memory``, so each branch is rewritten
+    to anchor at the line start and commit (atomic groups) to the earliest
+    occurrence of every word. Matching is then linear in the message length,
+    whereas the plain form is quadratic or worse on multi-kilobyte BigQuery
+    error payloads that repeat the leading words.
+    """
+    branches = []
+    anchors = []
+    for branch in pattern.split("|"):
+        first, *rest = branch.split(".*")
+        anchors.append(first.lower())
+        if rest:
+            branch = rf"^(?>[^\n]*?{first})" + "".join(
+                f"(?>.*?{word})" for word in rest
+            )
+        branches.append(branch)
+    compiled = re.compile("|".join(branches), re.IGNORECASE | re.MULTILINE)
+    _PATTERN_ANCHORS[compiled] = tuple(dict.fromkeys(anchors))
+    return compiled
+
+
+# Error pattern mapping for classification, compiled once and checked in order
+_CLASSIFICATION_PATTERNS = tuple(
+    (_compile_gapped(pattern), strategy, severity)
+    for pattern, strategy, severity in [
+        # Security errors - no recovery (check first, more specific)
+        (
+            r"permission.*denied|access.*denied|unauthorized|invalid.*api.*key|authentication.*failed|forbidden",
+            RecoveryStrategy.NO_RECOVERY,
+            ErrorSeverity.CRITICAL,
+        ),
+        # Network/timeout errors - immediate retry
+        (
+            r"timeout|connection.*reset|network.*error",
+            RecoveryStrategy.IMMEDIATE_RETRY,
+            ErrorSeverity.MEDIUM,
+        ),
+        (
+            r"rate.*limit|quota.*exceeded|too.*many.*requests",
+            RecoveryStrategy.EXPONENTIAL_BACKOFF,
+            ErrorSeverity.MEDIUM,
+        ),
+        # BigQuery specific errors
+        (
+            r"Array cannot have a null element",
+            RecoveryStrategy.IMMEDIATE_RETRY,
+            ErrorSeverity.MEDIUM,
+        ),
+        (r"dataset.*not.*found", RecoveryStrategy.NO_RECOVERY, ErrorSeverity.HIGH),
+        # LLM provider errors
+        (
+            r"model.*not.*found|model.*unavailable",
+            RecoveryStrategy.GRACEFUL_DEGRADATION,
+            ErrorSeverity.HIGH,
+        ),
+        # SQL and schema errors - user guided (retryable with simplification)
+        (
+            r"syntax.*error|invalid.*sql|parse.*error",
+            RecoveryStrategy.USER_GUIDED,
+            ErrorSeverity.HIGH,
+        ),
+        (
+            r"type.*mismatch|timestamp.*vs.*date|data.*type.*mismatch",
+            RecoveryStrategy.USER_GUIDED,
+            ErrorSeverity.MEDIUM,
+        ),
+        (
+            r"table.*not.*found|column.*not.*found",
+            RecoveryStrategy.USER_GUIDED,
+            ErrorSeverity.MEDIUM,
+        ),
+        # Security violations - permanent (non-retryable)
+        (
+            r"forbidden.*table|not.*in.*allowed.*tables|security.*violation",
+            RecoveryStrategy.NO_RECOVERY,
+            ErrorSeverity.CRITICAL,
+        ),
+        # System errors
+        (
+            r"out.*of.*memory|disk.*full",
+            RecoveryStrategy.GRACEFUL_DEGRADATION,
+            ErrorSeverity.HIGH,
+        ),
+        (
+            r"internal.*server.*error",
+            RecoveryStrategy.EXPONENTIAL_BACKOFF,
+            ErrorSeverity.MEDIUM,
+        ),
+    ]
+)
+
+# Security-related message patterns (should not be retried)
+_SECURITY_PATTERNS = tuple(
+    _compile_gapped(pattern)
+    for pattern in (
+        r"permission.*denied",
+        r"access.*denied",
+        r"unauthorized",
+        r"invalid.*api.*key",
+        r"authentication.*failed",
+        r"forbidden",
+    )
+)
+
+# Lowercase keywords marking a BigQuery error as a schema issue
+_SCHEMA_KEYWORDS = ("not found", "does not exist", "syntax error", "invalid")
+
+# User-facing messages for lowercase message keywords, checked in order
+_USER_MESSAGE_KEYWORDS = (
+    (
+        ("type mismatch", "timestamp vs date"),
+        "Data type issue detected. Automatically simplifying query...",
+    ),
+    (("timeout",), "Operation took longer than expected. Retrying..."),
+    (
+        ("rate limit", "quota"),
+        "Service temporarily unavailable due to usage limits. Retrying shortly...",
+    ),
+    (
+        ("table not found", "column not found"),
+        "Unable to complete request. Please check your table or column names.",
+    ),
+)
+
+_SEVERITY_USER_MESSAGES = {
+    ErrorSeverity.CRITICAL: "Critical system error. Please contact support.",
+    ErrorSeverity.HIGH: "Unable to complete request. Please try a different approach.",
+}
+
+
+def _is_security_message(error_message: str, error_lower: str) -> bool:
+    """Match security patterns, skipping those whose anchor words are absent."""
+    return any(
+        pattern.search(error_message)
+        for pattern in _SECURITY_PATTERNS
+        if any(anchor in error_lower for anchor in _PATTERN_ANCHORS[pattern])
+    )
+
+
 class ErrorClassifier:
     """Classifies errors and maps them to recovery strategies."""
 
     def __init__(self):
-        # Error pattern mapping for classification
-        self._patterns = [
-            # Security errors - no recovery (check first, more specific)
-            (
-                r"permission.*denied|access.*denied|unauthorized|invalid.*api.*key|authentication.*failed|forbidden",
-                RecoveryStrategy.NO_RECOVERY,
-                ErrorSeverity.CRITICAL,
-            ),
-            # Network/timeout errors - immediate retry
-            (
-                r"timeout|connection.*reset|network.*error",
-                RecoveryStrategy.IMMEDIATE_RETRY,
-                ErrorSeverity.MEDIUM,
-            ),
-            (
-                r"rate.*limit|quota.*exceeded|too.*many.*requests",
-                RecoveryStrategy.EXPONENTIAL_BACKOFF,
-                ErrorSeverity.MEDIUM,
-            ),
-            # BigQuery specific errors
-            (
-                r"Array cannot have a null element",
-                RecoveryStrategy.IMMEDIATE_RETRY,
-                ErrorSeverity.MEDIUM,
-            ),
-            (r"dataset.*not.*found", RecoveryStrategy.NO_RECOVERY, ErrorSeverity.HIGH),
-            # LLM provider errors
-            (
-                r"model.*not.*found|model.*unavailable",
-                RecoveryStrategy.GRACEFUL_DEGRADATION,
-                ErrorSeverity.HIGH,
-            ),
-            # SQL and schema errors - user guided (retryable with simplification)
-            (
-                r"syntax.*error|invalid.*sql|parse.*error",
-                RecoveryStrategy.USER_GUIDED,
-                ErrorSeverity.HIGH,
-            ),
-            (
-                r"type.*mismatch|timestamp.*vs.*date|data.*type.*mismatch",
-                RecoveryStrategy.USER_GUIDED,
-                ErrorSeverity.MEDIUM,
-            ),
-            (
-                r"table.*not.*found|column.*not.*found",
-                RecoveryStrategy.USER_GUIDED,
-                ErrorSeverity.MEDIUM,
-            ),
-            # Security violations - permanent (non-retryable)
-            (
-                r"forbidden.*table|not.*in.*allowed.*tables|security.*violation",
-                RecoveryStrategy.NO_RECOVERY,
-                ErrorSeverity.CRITICAL,
-            ),
-            # System errors
-            (
-                r"out.*of.*memory|disk.*full",
-                RecoveryStrategy.GRACEFUL_DEGRADATION,
-                ErrorSeverity.HIGH,
-            ),
-            (
-                r"internal.*server.*error",
-                RecoveryStrategy.EXPONENTIAL_BACKOFF,
-                ErrorSeverity.MEDIUM,
-            ),
-        ]
+        self._patterns = list(_CLASSIFICATION_PATTERNS)
+        # Retries re-classify the same messages; memoize pattern matching per
+        # message (call clear_cache() after editing _patterns)
+        self._match_cached = lru_cache(maxsize=1024)(self._match_patterns)
+
+    def clear_cache(self) -> None:
+        """Drop memoized message classifications."""
+        self._match_cached.cache_clear()
 
     def classify(
         self, error: Union[Exception, str]
@@ -111,20 +202,12 @@ class ErrorClassifier:
         Returns:
             Tuple of (RecoveryStrategy, ErrorSeverity)
         """
-        # Pattern matching on error message
-        error_message = str(error).lower()
-
         # Check error type first for known LGDA errors
         if isinstance(error, LGDAError):
             return self._classify_lgda_error(error)
 
         # Pattern matching on error message
-        for pattern, strategy, severity in self._patterns:
-            if re.search(pattern, error_message, re.IGNORECASE):
-                return strategy, severity
-
-        # Default classification for unknown errors
-        return RecoveryStrategy.USER_GUIDED, ErrorSeverity.MEDIUM
+        return self._classify_by_patterns(str(error))
 
     def _classify_lgda_error(
         self, error: LGDAError
@@ -147,13 +230,7 @@ class ErrorClassifier:
             if result == (RecoveryStrategy.USER_GUIDED, ErrorSeverity.MEDIUM):
                 # Check if this is a schema/permission issue that should stay USER_GUIDED
                 error_lower = error.message.lower()
-                schema_patterns = [
-                    "not found",
-                    "does not exist",
-                    "syntax error",
-                    "invalid",
-                ]
-                if any(pattern in error_lower for pattern in schema_patterns):
+                if any(keyword in error_lower for keyword in _SCHEMA_KEYWORDS):
                     return result  # Keep USER_GUIDED for schema issues
                 # For other generic execution errors, use exponential backoff
                 return RecoveryStrategy.EXPONENTIAL_BACKOFF, ErrorSeverity.MEDIUM
@@ -165,11 +242,18 @@ class ErrorClassifier:
         self, error_message: str
     ) -> tuple[RecoveryStrategy, ErrorSeverity]:
         """Classify error by pattern matching."""
-        error_message = error_message.lower()
+        return self._match_cached(error_message)
 
-        # Pattern matching on error message
+    def _match_patterns(
+        self, error_message: str
+    ) -> tuple[RecoveryStrategy, ErrorSeverity]:
+        # Skip the regex for patterns whose anchor words are all absent
+        error_lower = error_message.lower()
         for pattern, strategy, severity in self._patterns:
-            if re.search(pattern, error_message, re.IGNORECASE):
+            anchors = _PATTERN_ANCHORS.get(pattern)
+            if anchors and not any(anchor in error_lower for anchor in anchors):
+                continue
+            if pattern.search(error_message):
                 return strategy, severity
 
         # Default classification
@@ -201,20 +285,8 @@ class ErrorClassifier:
         Returns:
             True if error is security-related
         """
-        error_message = str(error).lower()
-        security_patterns = [
-            r"permission.*denied",
-            r"access.*denied",
-            r"unauthorized",
-            r"invalid.*api.*key",
-            r"authentication.*failed",
-            r"forbidden",
-        ]
-
-        return any(
-            re.search(pattern, error_message, re.IGNORECASE)
-            for pattern in security_patterns
-        )
+        error_message = str(error)
+        return _is_security_message(error_message, error_message.lower())
 
     def get_user_message(self, error: Union[Exception, str]) -> str:
         """
@@ -226,35 +298,22 @@ class ErrorClassifier:
         Returns:
             User-friendly error message
         """
-        strategy, severity = self.classify(error)
+        # Lowercase once for the security prefilter and the keyword table
         error_message = str(error)
+        error_lower = error_message.lower()
 
-        if self.is_security_error(error):
+        if _is_security_message(error_message, error_lower):
             return "Access denied. Please check your permissions and credentials."
 
         if "Array cannot have a null element" in error_message:
             return "Data processing issue detected. Automatically applying fix..."
 
-        if "type mismatch" in error_message.lower() or "timestamp vs date" in error_message.lower():
-            return "Data type issue detected. Automatically simplifying query..."
-
-        if "timeout" in error_message.lower():
-            return "Operation took longer than expected. Retrying..."
-
-        if "rate limit" in error_message.lower() or "quota" in error_message.lower():
-            return "Service temporarily unavailable due to usage limits. Retrying shortly..."
+        # Scan the keyword table in priority order
+        for keywords, user_message in _USER_MESSAGE_KEYWORDS:
+            if any(keyword in error_lower for keyword in keywords):
+                return user_message
 
-        if (
-            "table not found" in error_message.lower()
-            or "column not found" in error_message.lower()
-        ):
-            return (
-                "Unable to complete request. Please check your table or column names."
-            )
-
-        if severity == ErrorSeverity.CRITICAL:
-            return "Critical system error. Please contact support."
-        elif severity == ErrorSeverity.HIGH:
-            return "Unable to complete request. Please try a different approach."
-        else:
-            return "Temporary issue encountered. Retrying automatically..."
+        _, severity = self.classify(error)
+        return _SEVERITY_USER_MESSAGES.get(
+            severity, "Temporary issue encountered. Retrying automatically..."
+        )
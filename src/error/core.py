@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 class LGDAError(Exception):
     """Base exception with error context for LGDA operations."""
@@ -16,9 +19,15 @@ class LGDAError(Exception):
         self.message = message
         self.error_code = error_code
         self.context = context or {}
-        self.timestamp = datetime.now(timezone.utc)
+        # Raw wall-clock stamp; converted to a datetime only when read
+        self._timestamp_ns = time.time_ns()
         super().__init__(message)
 
+    @property
+    def timestamp(self) -> datetime:
+        """UTC time at which the error was created."""
+        return _EPOCH + timedelta(microseconds=self._timestamp_ns // 1000)
+
     def __str__(self) -> str:
         return f"[{self.error_code}] {self.message}"
 
@@ -76,7 +85,7 @@ class TimeoutError(LGDAError):
         self.operation = operation
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorRecovery:
     """Data structure for error recovery information."""
 
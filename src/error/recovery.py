@@ -3,11 +3,46 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Callable, Dict, Optional
+import threading
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional
 
 from .classification import ErrorClassifier, RecoveryStrategy
 from .core import BigQueryExecutionError, ErrorRecovery
 
+# Rewrites that drop NULL elements from array constructors, applied in order
+_ARRAY_NULL_FIXES = (
+    # ARRAY[...] constructor with potential nulls
+    (
+        re.compile(r"ARRAY\s*\[\s*([^\]]+)\s*\]", re.IGNORECASE),
+        r"ARRAY(SELECT x FROM UNNEST([\1]) AS x WHERE x IS NOT NULL)",
+    ),
+    # ARRAY(...) constructor with potential nulls
+    (
+        re.compile(r"ARRAY\s*\(\s*([^)]+)\s*\)", re.IGNORECASE),
+        r"ARRAY(SELECT x FROM UNNEST([\1]) AS x WHERE x IS NOT NULL)",
+    ),
+    # ARRAY_AGG with potential nulls
+    (
+        re.compile(r"ARRAY_AGG\s*\(\s*([^)]+)\s*\)", re.IGNORECASE),
+        r"ARRAY_AGG(\1 IGNORE NULLS)",
+    ),
+)
+
+# Shared read-only stand-in for a missing context (strategies never mutate it)
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+
+def _operation_key(operation: Optional[Callable]) -> str:
+    """Retry-count key for an operation passed without an operation_id.
+
+    str() is the same for every access to one object's bound method and, unlike
+    the callable itself, does not keep the operation (or a bound method's
+    ``__self__``) alive in the process-global engine's counters.
+    """
+    return str(operation) if operation else "unknown"
+
 
 class RecoveryEngine:
     """Engine for executing error recovery strategies."""
@@ -20,7 +55,15 @@ class RecoveryEngine:
             classifier: Error classifier instance
         """
         self.classifier = classifier or ErrorClassifier()
-        self._retry_counts: Dict[str, int] = {}
+        # Keyed by operation_id, or str() of the operation callable
+        self._retry_counts: Counter[Hashable] = Counter()
+        self._dispatch = {
+            RecoveryStrategy.IMMEDIATE_RETRY: self._immediate_retry_recovery,
+            RecoveryStrategy.EXPONENTIAL_BACKOFF: self._exponential_backoff_recovery,
+            RecoveryStrategy.GRACEFUL_DEGRADATION: self._graceful_degradation_recovery,
+            RecoveryStrategy.USER_GUIDED: self._user_guided_recovery,
+            RecoveryStrategy.NO_RECOVERY: self._no_recovery,
+        }
 
     async def handle_error(
         self,
@@ -40,28 +83,22 @@ class RecoveryEngine:
             ErrorRecovery with recommended action
         """
         strategy, severity = self.classifier.classify(error)
-        context = context or {}
+        context = context or _EMPTY_CONTEXT
 
         # Get operation identifier for retry tracking
-        op_id = context.get("operation_id", str(operation) if operation else "unknown")
+        op_id = context.get("operation_id")
+        if op_id is None:
+            op_id = _operation_key(operation)
 
         # Apply recovery strategy
-        if strategy == RecoveryStrategy.IMMEDIATE_RETRY:
-            return await self._immediate_retry_recovery(error, op_id, context)
-        elif strategy == RecoveryStrategy.EXPONENTIAL_BACKOFF:
-            return await self._exponential_backoff_recovery(error, op_id, context)
-        elif strategy == RecoveryStrategy.GRACEFUL_DEGRADATION:
-            return await self._graceful_degradation_recovery(error, op_id, context)
-        elif strategy == RecoveryStrategy.USER_GUIDED:
-            return await self._user_guided_recovery(error, op_id, context)
-        else:  # NO_RECOVERY
-            return await self._no_recovery(error, op_id, context)
+        handler = self._dispatch.get(strategy, self._no_recovery)
+        return await handler(error, op_id, context)
 
     async def _immediate_retry_recovery(
-        self, error: Exception, op_id: str, context: Dict[str, Any]
+        self, error: Exception, op_id: Hashable, context: Mapping[str, Any]
     ) -> ErrorRecovery:
         """Handle immediate retry recovery (< 1 second)."""
-        retry_count = self._retry_counts.get(op_id, 0)
+        retry_count = self._retry_counts[op_id]
         max_retries = 3
 
         if retry_count >= max_retries:
@@ -77,7 +114,7 @@ class RecoveryEngine:
         if isinstance(error, BigQueryExecutionError):
             modified_input = self._handle_bigquery_array_error(error)
 
-        self._retry_counts[op_id] = retry_count + 1
+        self._retry_counts[op_id] += 1
 
         return ErrorRecovery(
             strategy="immediate_retry",
@@ -90,10 +127,10 @@ class RecoveryEngine:
         )
 
     async def _exponential_backoff_recovery(
-        self, error: Exception, op_id: str, context: Dict[str, Any]
+        self, error: Exception, op_id: Hashable, context: Mapping[str, Any]
     ) -> ErrorRecovery:
         """Handle exponential backoff recovery (1-10 seconds)."""
-        retry_count = self._retry_counts.get(op_id, 0)
+        retry_count = self._retry_counts[op_id]
         max_retries = 5
 
         if retry_count >= max_retries:
@@ -107,7 +144,7 @@ class RecoveryEngine:
         # Calculate exponential backoff delay: 2^retry_count seconds, max 10s
         delay = min(2**retry_count, 10)
 
-        self._retry_counts[op_id] = retry_count + 1
+        self._retry_counts[op_id] += 1
 
         return ErrorRecovery(
             strategy="exponential_backoff",
@@ -119,11 +156,12 @@ class RecoveryEngine:
         )
 
     async def _graceful_degradation_recovery(
-        self, error: Exception, op_id: str, context: Dict[str, Any]
+        self, error: Exception, op_id: Hashable, context: Mapping[str, Any]
     ) -> ErrorRecovery:
         """Handle graceful degradation recovery."""
         # Determine degradation strategy based on error and context
-        if "model" in str(error).lower():
+        error_lower = str(error).lower()
+        if "model" in error_lower:
             return ErrorRecovery(
                 strategy="model_fallback",
                 modified_input={"fallback_model": True},
@@ -132,7 +170,7 @@ class RecoveryEngine:
                 user_message="Using alternative approach for your request...",
             )
 
-        if "memory" in str(error).lower() or "resource" in str(error).lower():
+        if "memory" in error_lower or "resource" in error_lower:
             return ErrorRecovery(
                 strategy="simplified_processing",
                 modified_input={"simplified": True, "chunk_size": 100},
@@ -151,12 +189,12 @@ class RecoveryEngine:
         )
 
     async def _user_guided_recovery(
-        self, error: Exception, op_id: str, context: Dict[str, Any]
+        self, error: Exception, op_id: Hashable, context: Mapping[str, Any]
     ) -> ErrorRecovery:
         """Handle user-guided recovery (> 10 seconds)."""
-        error_msg = str(error)
+        error_lower = str(error).lower()
 
-        if "syntax" in error_msg.lower() or "sql" in error_msg.lower():
+        if "syntax" in error_lower or "sql" in error_lower:
             return ErrorRecovery(
                 strategy="user_clarification",
                 should_retry=False,
@@ -164,7 +202,7 @@ class RecoveryEngine:
                 user_message="Please rephrase your question or provide more specific details.",
             )
 
-        if "table" in error_msg.lower() or "column" in error_msg.lower():
+        if "table" in error_lower or "column" in error_lower:
             return ErrorRecovery(
                 strategy="schema_guidance",
                 should_retry=False,
@@ -180,7 +218,7 @@ class RecoveryEngine:
         )
 
     async def _no_recovery(
-        self, error: Exception, op_id: str, context: Dict[str, Any]
+        self, error: Exception, op_id: Hashable, context: Mapping[str, Any]
     ) -> ErrorRecovery:
         """Handle non-recoverable errors."""
         return ErrorRecovery(
@@ -210,53 +248,47 @@ class RecoveryEngine:
 
         # Add null handling to array operations
         query = error.query
-
-        # Common patterns to fix
-        patterns = [
-            # ARRAY[...] constructor with potential nulls
-            (
-                r"ARRAY\s*\[\s*([^\]]+)\s*\]",
-                r"ARRAY(SELECT x FROM UNNEST([\1]) AS x WHERE x IS NOT NULL)",
-            ),
-            # ARRAY(...) constructor with potential nulls
-            (
-                r"ARRAY\s*\(\s*([^)]+)\s*\)",
-                r"ARRAY(SELECT x FROM UNNEST([\1]) AS x WHERE x IS NOT NULL)",
-            ),
-            # ARRAY_AGG with potential nulls
-            (r"ARRAY_AGG\s*\(\s*([^)]+)\s*\)", r"ARRAY_AGG(\1 IGNORE NULLS)"),
-        ]
+        if "array" not in query.lower():
+            return None
 
         modified_query = query
-        for pattern, replacement in patterns:
-            modified_query = re.sub(
-                pattern, replacement, modified_query, flags=re.IGNORECASE
-            )
+        for pattern, replacement in _ARRAY_NULL_FIXES:
+            modified_query = pattern.sub(replacement, modified_query)
 
         return modified_query if modified_query != query else None
 
-    def reset_retry_count(self, op_id: str) -> None:
+    def reset_retry_count(self, op_id: Hashable) -> None:
         """Reset retry count for an operation."""
         self._retry_counts.pop(op_id, None)
 
-    def get_retry_count(self, op_id: str) -> int:
+    def get_retry_count(self, op_id: Hashable) -> int:
         """Get current retry count for an operation."""
         return self._retry_counts.get(op_id, 0)
 
 
 # Global recovery engine instance
 _default_recovery_engine: Optional[RecoveryEngine] = None
+_default_recovery_engine_lock = threading.Lock()
 
 
 def get_recovery_engine() -> RecoveryEngine:
-    """Get or create the default recovery engine."""
+    """Get or create the default recovery engine.
+
+    Double-checked locking guarantees a single engine (and so a single set of
+    retry counts) even under concurrent first use.
+    """
     global _default_recovery_engine
-    if _default_recovery_engine is None:
-        _default_recovery_engine = RecoveryEngine()
-    return _default_recovery_engine
+    engine = _default_recovery_engine
+    if engine is None:
+        with _default_recovery_engine_lock:
+            engine = _default_recovery_engine
+            if engine is None:
+                engine = _default_recovery_engine = RecoveryEngine()
+    return engine
 
 
 def set_recovery_engine(engine: RecoveryEngine) -> None:
     """Set the default recovery engine."""
     global _default_recovery_engine
-    _default_recovery_engine = engine
+    with _default_recovery_engine_lock:
+        _default_recovery_engine = engine
@@ -52,8 +52,10 @@ class TimeoutManager:
         self._active_operations[operation_name] = start_time
 
         try:
-            result = await asyncio.wait_for(operation, timeout=timeout)
-            return result
+            # asyncio.timeout reschedules a deadline on the current task rather
+            # than wrapping the operation in a new Task as wait_for does
+            async with asyncio.timeout(timeout):
+                return await operation
         except asyncio.TimeoutError:
             # Force cleanup and raise appropriate error
             await self._force_cleanup(operation_name)
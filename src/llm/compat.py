@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
 import sys
-from typing import Optional
+import threading
+from typing import Any, Coroutine, Optional, Tuple, TypeVar
 from unittest.mock import MagicMock  # type: ignore
 
 from ..config import settings
@@ -18,6 +20,91 @@ from .providers.nvidia_openai import NvidiaOpenAIProvider
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Persistent event loop (on a daemon thread) that runs provider coroutines for
+# the synchronous wrappers below
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the shared background event loop."""
+    global _background_loop
+    loop = _background_loop
+    if loop is None:
+        with _background_loop_lock:
+            loop = _background_loop
+            if loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="llm-compat-loop", daemon=True
+                ).start()
+                _background_loop = loop
+    return loop
+
+
+async def _run_in_context(
+    coro: Coroutine[Any, Any, T], context: contextvars.Context
+) -> T:
+    # A task copies the context current at creation, which on the background
+    # thread is not the caller's; create it with the caller's copy instead
+    return await asyncio.get_running_loop().create_task(coro, context=context)
+
+
+def _run_sync(coro: Coroutine[Any, Any, T], timeout: float) -> T:
+    """Run ``coro`` to completion on the background loop and return its result.
+
+    Works whether or not the calling thread already has a running loop, and
+    avoids building a new event loop (and thread pool) per call. The coroutine
+    sees a copy of the caller's contextvars (tracing, request context), and is
+    cancelled if it does not finish within ``timeout`` seconds.
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        _run_in_context(coro, contextvars.copy_context()), _get_background_loop()
+    )
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise TimeoutError(f"LLM call did not complete within {timeout}s") from None
+
+
+# Deterministic responses used when no real provider call should be made
+_SYNTHETIC_PLAN = (
+    '{"task": "analysis", "tables": ["orders"], '
+    '"metrics": ["revenue"], "filters": ["status = Complete"]}'
+)
+_SYNTHETIC_SQL = (
+    "SELECT status, COUNT(*) AS cnt FROM orders "
+    "WHERE status = 'Complete' GROUP BY status"
+)
+_SYNTHETIC_REPORT = (
+    "Executive summary: revenue increased by 12% QoQ. Sales growth is "
+    "concentrated in top regions. Key insights include seasonal "
+    "patterns and product mix shifts. Recommended actions: deepen "
+    "customer analysis, optimize pricing, and expand marketing."
+)
+
+# (lowercase keywords, response) rules, checked in order
+_SQL_FIRST_RULES = (
+    (("sql", "select"), _SYNTHETIC_SQL),
+    (("plan", "schema", "json"), _SYNTHETIC_PLAN),
+)
+_PLAN_FIRST_RULES = (_SQL_FIRST_RULES[1], _SQL_FIRST_RULES[0])
+
+
+def _synthetic_response(
+    prompt: Optional[str], rules: Tuple[Tuple[Tuple[str, ...], str], ...]
+) -> str:
+    """Pick a synthetic response by keyword, lowercasing the prompt once."""
+    prompt_lower = (prompt or "").lower()
+    for keywords, response in rules:
+        if any(keyword in prompt_lower for keyword in keywords):
+            return response
+    # Default to a report-like response
+    return _SYNTHETIC_REPORT
+
 
 def llm_completion(
     prompt: str,
@@ -38,8 +125,8 @@ def llm_completion(
         prompt=prompt,
         context=LLMContext.GENERAL,
         system_prompt=system,
-        max_tokens=llm_config.get_max_tokens_for_context("general"),
-        temperature=llm_config.get_temperature_for_context("general"),
+        max_tokens=llm_config.get_max_tokens_for_context(LLMContext.GENERAL),
+        temperature=llm_config.get_temperature_for_context(LLMContext.GENERAL),
     )
 
     # Decide execution mode
@@ -73,43 +160,11 @@ def llm_completion(
                 return ""
             if not isinstance(text, str):
                 # Some mocks may return a Mock for .text; fallback to deterministic behavior
-                p = (prompt or "").lower()
-                if "plan" in p or "schema" in p or "json" in p:
-                    return (
-                        '{"task": "analysis", "tables": ["orders"], '
-                        '"metrics": ["revenue"], "filters": ["status = Complete"]}'
-                    )
-                if "sql" in p or "select" in p:
-                    return (
-                        "SELECT status, COUNT(*) AS cnt FROM orders "
-                        "WHERE status = 'Complete' GROUP BY status"
-                    )
-                return (
-                    "Executive summary: revenue increased by 12% QoQ. Sales growth is "
-                    "concentrated in top regions. Key insights include seasonal "
-                    "patterns and product mix shifts. Recommended actions: deepen "
-                    "customer analysis, optimize pricing, and expand marketing."
-                )
+                return _synthetic_response(prompt, _PLAN_FIRST_RULES)
             return text
 
         # If legacy not patched, avoid real provider calls in unit tests; return synthetic
-        p = (prompt or "").lower()
-        if "sql" in p or "select" in p:
-            return (
-                "SELECT status, COUNT(*) AS cnt FROM orders "
-                "WHERE status = 'Complete' GROUP BY status"
-            )
-        if "plan" in p or "schema" in p or "json" in p:
-            return (
-                '{"task": "analysis", "tables": ["orders"], '
-                '"metrics": ["revenue"], "filters": ["status = Complete"]}'
-            )
-        return (
-            "Executive summary: revenue increased by 12% QoQ. Sales growth is "
-            "concentrated in top regions. Key insights include seasonal "
-            "patterns and product mix shifts. Recommended actions: deepen "
-            "customer analysis, optimize pricing, and expand marketing."
-        )
+        return _synthetic_response(prompt, _SQL_FIRST_RULES)
 
     use_provider = True
     if use_provider:
@@ -128,21 +183,9 @@ def llm_completion(
 
         # Execute synchronously
         try:
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    import concurrent.futures
-
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(
-                            asyncio.run, provider.generate_text(request)
-                        )
-                        response = future.result()
-                else:
-                    response = loop.run_until_complete(provider.generate_text(request))
-            except RuntimeError:
-                response = asyncio.run(provider.generate_text(request))
-
+            response = _run_sync(
+                provider.generate_text(request), timeout=llm_config.request_timeout
+            )
             return response.text
         except Exception as e:
             # Do not swallow errors here; tests expect exceptions to propagate
@@ -150,24 +193,7 @@ def llm_completion(
             raise
     else:
         # Synthetic deterministic responses when not using provider
-        p = (prompt or "").lower()
-        if "sql" in p or "select" in p:
-            return (
-                "SELECT status, COUNT(*) AS cnt FROM orders "
-                "WHERE status = 'Complete' GROUP BY status"
-            )
-        if "plan" in p or "schema" in p or "json" in p:
-            return (
-                '{"task": "analysis", "tables": ["orders"], '
-                '"metrics": ["revenue"], "filters": ["status = Complete"]}'
-            )
-        # Default to a report-like response
-        return (
-            "Executive summary: revenue increased by 12% QoQ. Sales growth is "
-            "concentrated in top regions. Key insights include seasonal "
-            "patterns and product mix shifts. Recommended actions: deepen "
-            "customer analysis, optimize pricing, and expand marketing."
-        )
+        return _synthetic_response(prompt, _SQL_FIRST_RULES)
 
 
 def llm_fallback(prompt: str, system: Optional[str] = None) -> str:
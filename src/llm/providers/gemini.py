@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import time
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 
 import google.generativeai as genai
 from google.generativeai.types import HarmBlockThreshold, HarmCategory
@@ -56,10 +58,8 @@ class GeminiProvider(BaseLLMProvider):
     def _get_model(self):
         """Get or create model instance."""
         if self._model is None:
-            # Use keyword for model name to match tests' expectations
-            self._model = genai.GenerativeModel(
-                model_name=self.model_name,
-                safety_settings=self.SAFETY_SETTINGS,
+            self._model = _generative_model(
+                genai.GenerativeModel, self.model_name, type(self), _api_key()
             )
         return self._model
 
@@ -177,3 +177,27 @@ class GeminiProvider(BaseLLMProvider):
             "vertex_ai": self.use_vertex_ai,
             "safety_settings": "enterprise",
         }
+
+
+def _api_key() -> Optional[str]:
+    """API key new models will authenticate with (settings, else environment)."""
+    return settings.google_api_key or os.getenv("GOOGLE_API_KEY")
+
+
+@lru_cache(maxsize=8)
+def _generative_model(
+    factory: Callable[..., Any],
+    model_name: str,
+    provider_cls: type,
+    api_key: Optional[str],
+) -> Any:
+    """Build a GenerativeModel once per model name, provider class and API key.
+
+    The compatibility layer creates a provider per call, so without this
+    every request would construct a new model. ``factory`` is part of the key
+    so a patched ``genai`` never receives a model built by another one, and
+    ``api_key`` so a model bound to a previous key's client is never reused,
+    however the key was changed (settings reload or environment).
+    """
+    # Use keyword for model name to match tests' expectations
+    return factory(model_name=model_name, safety_settings=provider_cls.SAFETY_SETTINGS)
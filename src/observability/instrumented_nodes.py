@@ -8,6 +8,7 @@ nodes, with observability being optional and configurable.
 """
 
 import logging
+import re
 import time
 from functools import wraps
 from typing import Any, Dict, Optional
@@ -29,6 +30,13 @@ from .tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
+# Single-pass SQL complexity scan; each named group is one indicator
+_SQL_COMPLEXITY_PATTERN = re.compile(
+    r"(?P<join>join)|(?P<group_by>group by)|(?P<order_by>order by)"
+    r"|(?P<having>having)|(?P<window>window|over\()",
+    re.IGNORECASE,
+)
+
 
 def instrument_node(node_name: str):
     """Decorator to instrument pipeline nodes with observability."""
@@ -143,17 +151,9 @@ def _determine_query_complexity(question: str, sql: str = "") -> QueryComplexity
     sql_length = len(sql)
 
     # Count complexity indicators
-    complexity_indicators = 0
-    if "join" in sql.lower():
-        complexity_indicators += 1
-    if "group by" in sql.lower():
-        complexity_indicators += 1
-    if "order by" in sql.lower():
-        complexity_indicators += 1
-    if "having" in sql.lower():
-        complexity_indicators += 1
-    if "window" in sql.lower() or "over(" in sql.lower():
-        complexity_indicators += 1
+    complexity_indicators = len(
+        {match.lastgroup for match in _SQL_COMPLEXITY_PATTERN.finditer(sql)}
+    )
 
     # Determine complexity
     if question_length < 50 and complexity_indicators == 0:
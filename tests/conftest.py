@@ -12,6 +12,9 @@ import pytest
 from google.api_core.exceptions import BadRequest
 from google.cloud import bigquery
 
+# Tests reload src.config; let it publish canonical classes into builtins
+os.environ.setdefault("LGDA_TEST_RELOAD_SHIM", "1")
+
 # Test data directory
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -135,26 +138,31 @@ def sample_schema_response():
     ]
 
 
+# Static query result template, built once at import; fixtures hand out
+# shallow copies so per-test construction and dtype inference are skipped.
+_SAMPLE_QUERY_RESULT = pd.DataFrame(
+    {
+        "order_id": [1, 2, 3, 4, 5],
+        "user_id": [100, 101, 102, 103, 104],
+        "status": ["Complete", "Processing", "Complete", "Cancelled", "Complete"],
+        "total_amount": [45.99, 89.50, 123.75, 67.25, 156.00],
+        "created_at": pd.to_datetime(
+            [
+                "2024-01-01 10:00:00",
+                "2024-01-02 14:30:00",
+                "2024-01-03 09:15:00",
+                "2024-01-04 16:45:00",
+                "2024-01-05 11:20:00",
+            ]
+        ),
+    }
+)
+
+
 @pytest.fixture
 def sample_query_result():
     """Sample query result DataFrame."""
-    return pd.DataFrame(
-        {
-            "order_id": [1, 2, 3, 4, 5],
-            "user_id": [100, 101, 102, 103, 104],
-            "status": ["Complete", "Processing", "Complete", "Cancelled", "Complete"],
-            "total_amount": [45.99, 89.50, 123.75, 67.25, 156.00],
-            "created_at": pd.to_datetime(
-                [
-                    "2024-01-01 10:00:00",
-                    "2024-01-02 14:30:00",
-                    "2024-01-03 09:15:00",
-                    "2024-01-04 16:45:00",
-                    "2024-01-05 11:20:00",
-                ]
-            ),
-        }
-    )
+    return _SAMPLE_QUERY_RESULT.copy()
 
 
 @pytest.fixture
@@ -318,6 +326,44 @@ def isolate_tests(reset_global_client, reset_circuit_breaker, mock_env_vars):
     pass
 
 
+@pytest.fixture
+def concurrent_first_use():
+    """Race threads through a lazy singleton getter with a slow factory.
+
+    Returns a callable taking the module, its cached-instance attribute, the
+    factory attribute and the getter; it yields ``(created, results)`` so the
+    test can assert exactly one instance was built and shared.
+    """
+    import threading
+    import time
+
+    def run(module, cache_attr, factory_attr, getter, threads=8):
+        created = []
+
+        def slow_factory():
+            time.sleep(0.01)
+            created.append(object())
+            return created[-1]
+
+        results = []
+        with (
+            patch.object(module, cache_attr, None),
+            patch.object(module, factory_attr, side_effect=slow_factory),
+        ):
+            workers = [
+                threading.Thread(target=lambda: results.append(getter()))
+                for _ in range(threads)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        return created, results
+
+    return run
+
+
 # Error fixtures for testing exception handling
 @pytest.fixture
 def mock_bigquery_error():
@@ -1,6 +1,6 @@
 """Tests for error classification functionality."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -27,6 +27,17 @@ class TestErrorClassifier:
         assert hasattr(classifier, "_patterns")
         assert len(classifier._patterns) > 0
 
+    def test_patterns_are_precompiled(self, classifier):
+        """Classification patterns are compiled once, case-insensitively."""
+        import re
+
+        for pattern, _, _ in classifier._patterns:
+            assert isinstance(pattern, re.Pattern)
+            assert pattern.flags & re.IGNORECASE
+
+        strategy, _ = classifier.classify("ARRAY CANNOT HAVE A NULL ELEMENT")
+        assert strategy == RecoveryStrategy.IMMEDIATE_RETRY
+
     # Test pattern-based classification
     def test_classify_timeout_error(self, classifier):
         """Test classification of timeout errors."""
@@ -163,6 +174,85 @@ class TestErrorClassifier:
         message = classifier.get_user_message("access denied")
         assert "Access denied" in message
 
+    def test_pattern_matching_memoized_per_message(self, classifier):
+        """Repeated messages reuse the memoized classification."""
+        first = classifier.classify("Rate limit exceeded")
+        again = classifier.classify("Rate limit exceeded")
+
+        assert again == first
+        assert classifier._match_cached.cache_info().hits == 1
+
+        classifier.clear_cache()
+        assert classifier._match_cached.cache_info().currsize == 0
+
+    def test_get_user_message_keyword_priority(self, classifier):
+        """Keyword messages take precedence over severity-based messages."""
+        message = classifier.get_user_message("Type mismatch after TIMEOUT")
+        assert "Data type issue" in message
+
+        message = classifier.get_user_message("Quota hit: table not found")
+        assert "usage limits" in message
+
+        message = classifier.get_user_message("Syntax error near FROM")
+        assert message == (
+            "Unable to complete request. Please try a different approach."
+        )
+
+    def test_patterns_skipped_when_anchor_words_absent(self, classifier):
+        """Only patterns whose anchor words occur in the message are searched."""
+        import re
+
+        from src.error.classification import _PATTERN_ANCHORS
+
+        searched = []
+
+        class RecordingPattern:
+            def __init__(self, pattern):
+                self.pattern = pattern
+
+            def search(self, message):
+                searched.append(self.pattern.pattern)
+                return self.pattern.search(message)
+
+        recording = []
+        for pattern, strategy, severity in classifier._patterns:
+            wrapper = RecordingPattern(pattern)
+            _PATTERN_ANCHORS[wrapper] = _PATTERN_ANCHORS[pattern]
+            recording.append((wrapper, strategy, severity))
+        custom = re.compile("health probe", re.IGNORECASE)
+        recording.append(
+            (RecordingPattern(custom), RecoveryStrategy.NO_RECOVERY, ErrorSeverity.LOW)
+        )
+        classifier._patterns = recording
+        classifier.clear_cache()
+        try:
+            assert classifier.classify("Health Probe") == (
+                RecoveryStrategy.NO_RECOVERY,
+                ErrorSeverity.LOW,
+            )
+            # Only the custom pattern, which has no registered anchors, ran
+            assert searched == ["health probe"]
+        finally:
+            for wrapper, _, _ in recording[:-1]:
+                del _PATTERN_ANCHORS[wrapper]
+
+    def test_lgda_bigquery_error_code_not_scanned_for_keywords(self, classifier):
+        """Schema keywords are matched in the message, not the error code prefix."""
+        error = BigQueryExecutionError("Job failed while reading rows")
+        error.error_code = "INVALID_JOB_STATE"
+
+        strategy, _ = classifier.classify(error)
+        assert strategy == RecoveryStrategy.EXPONENTIAL_BACKOFF
+
+    def test_user_message_reflects_updated_error(self, classifier):
+        """Nothing is cached on the exception, so later edits are honored."""
+        error = Exception("Rate Limit exceeded")
+        assert "usage limits" in classifier.get_user_message(error)
+        assert not hasattr(error, "_lowered_message")
+
+        error.args = ("timeout",)
+        assert "longer than expected" in classifier.get_user_message(error)
+
     def test_get_user_message_high_severity_error(self, classifier):
         """Test user message for high severity errors."""
         message = classifier.get_user_message("Table not found")
@@ -240,3 +330,43 @@ class TestErrorClassificationPatterns:
             strategy, severity = classifier.classify(error)
             assert strategy == RecoveryStrategy.NO_RECOVERY
             assert severity == ErrorSeverity.CRITICAL
+
+    def test_gapped_patterns_match_words_in_order_per_line(self, classifier):
+        """Gapped patterns keep the original ``word.*word`` semantics."""
+        assert classifier.is_security_error("Permission to read table was denied")
+        assert not classifier.is_security_error("denied permission")
+        assert not classifier.is_security_error("permission check\nrequest denied")
+
+        strategy, _ = classifier.classify("job ran out of\nmemory, then out of memory")
+        assert strategy == RecoveryStrategy.GRACEFUL_DEGRADATION
+
+    def test_gapped_patterns_never_backtrack_over_gaps(self, classifier):
+        """Every ``.*`` gap is lazy inside an atomic group, so matching is linear."""
+        from src.error.classification import _SECURITY_PATTERNS
+
+        patterns = [pattern for pattern, _, _ in classifier._patterns]
+        for pattern in patterns + list(_SECURITY_PATTERNS):
+            assert ".*" not in pattern.pattern.replace("(?>.*?", "")
+
+        message = "out of " * 600 + "type timestamp vs " * 250
+        assert classifier.classify(message) == (
+            RecoveryStrategy.USER_GUIDED,
+            ErrorSeverity.MEDIUM,
+        )
+
+    def test_pattern_anchors_skip_regex_without_anchor_words(self, classifier):
+        """Patterns whose anchor words are absent are never searched."""
+        from src.error.classification import _PATTERN_ANCHORS
+
+        pattern = Mock()
+        pattern.search.return_value = None
+        classifier._patterns = [
+            (pattern, RecoveryStrategy.NO_RECOVERY, ErrorSeverity.CRITICAL)
+        ]
+
+        with patch.dict(_PATTERN_ANCHORS, {pattern: ("memory",)}):
+            classifier._match_patterns("x" * 10_000)
+            pattern.search.assert_not_called()
+
+            classifier._match_patterns("ran out of Memory")
+            pattern.search.assert_called_once_with("ran out of Memory")
@@ -1,6 +1,6 @@
 """Tests for core error classes and functionality."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 import pytest
@@ -29,6 +29,16 @@ class TestLGDAError:
         assert isinstance(error.timestamp, datetime)
         assert str(error) == "[TEST_ERROR] Test error"
 
+    def test_lgda_error_timestamp_is_utc_creation_time(self):
+        """Test the lazily built timestamp reflects creation time in UTC."""
+        before = datetime.now(timezone.utc)
+        error = LGDAError("Test error", "TEST_ERROR")
+        after = datetime.now(timezone.utc)
+
+        assert error.timestamp.tzinfo is timezone.utc
+        assert before - timedelta(milliseconds=1) <= error.timestamp <= after
+        assert error.to_dict()["timestamp"] == error.timestamp.isoformat()
+
     def test_lgda_error_without_context(self):
         """Test LGDA error creation without context."""
         error = LGDAError("Test error", "TEST_ERROR")
@@ -162,6 +172,14 @@ class TestErrorRecovery:
         assert recovery.should_retry is True
         assert recovery.user_message is None
 
+    def test_error_recovery_is_slotted(self):
+        """Test error recovery instances carry no per-instance __dict__."""
+        recovery = ErrorRecovery(strategy="no_retry")
+
+        assert not hasattr(recovery, "__dict__")
+        with pytest.raises(AttributeError):
+            recovery.unexpected = True
+
     def test_error_recovery_to_dict(self):
         """Test error recovery serialization."""
         recovery = ErrorRecovery(
@@ -214,6 +214,59 @@ class TestRecoveryEngine:
         engine.reset_retry_count("test_op")
         assert engine.get_retry_count("test_op") == 0
 
+    @pytest.mark.asyncio
+    async def test_retry_count_keyed_by_operation(self, engine):
+        """Test retries without operation_id are tracked per operation callable."""
+
+        def operation():
+            pass
+
+        await engine.handle_error(Exception("timeout occurred"), operation=operation)
+        await engine.handle_error(Exception("timeout occurred"), operation=operation)
+
+        assert engine.get_retry_count(str(operation)) == 2
+        assert engine.get_retry_count("unknown") == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_count_does_not_keep_operation_alive(self, engine):
+        """Test counted operations and their bound objects can be collected."""
+        import gc
+        import weakref
+
+        class Job:
+            def run(self):
+                pass
+
+        job = Job()
+        await engine.handle_error(Exception("timeout occurred"), operation=job.run)
+        job_ref = weakref.ref(job)
+        del job
+        gc.collect()
+
+        assert job_ref() is None
+
+    @pytest.mark.asyncio
+    async def test_retry_count_keyed_by_bound_method(self, engine):
+        """Test bound methods of one object share a counter across accesses."""
+
+        class Job:
+            def run(self):
+                pass
+
+        job, other_job = Job(), Job()
+        for _ in range(3):
+            await engine.handle_error(Exception("timeout occurred"), operation=job.run)
+        recovery = await engine.handle_error(
+            Exception("timeout occurred"), operation=job.run
+        )
+        assert recovery.should_retry is False
+
+        recovery = await engine.handle_error(
+            Exception("timeout occurred"), operation=other_job.run
+        )
+        assert recovery.should_retry is True
+        assert engine.get_retry_count(str(other_job.run)) == 1
+
     def test_bigquery_array_query_modification(self, engine):
         """Test BigQuery Array query modification logic."""
         error = BigQueryExecutionError(
@@ -232,6 +285,25 @@ class TestRecoveryEngine:
         modified_query = engine._handle_bigquery_array_error(error)
         assert modified_query is None
 
+    def test_bigquery_array_query_modification_query_without_arrays(self, engine):
+        """Queries with no array constructors are left untouched."""
+        error = BigQueryExecutionError(
+            "Array cannot have a null element", query="SELECT id FROM orders"
+        )
+
+        assert engine._handle_bigquery_array_error(error) is None
+
+    def test_bigquery_array_query_modification_lowercase(self, engine):
+        """Array rewrites are case-insensitive."""
+        error = BigQueryExecutionError(
+            "Array cannot have a null element",
+            query="select array[a, b] from t",
+        )
+
+        modified_query = engine._handle_bigquery_array_error(error)
+        assert modified_query is not None
+        assert "WHERE x IS NOT NULL" in modified_query
+
     def test_bigquery_array_query_modification_no_query(self, engine):
         """Test query modification when no query is provided."""
         error = BigQueryExecutionError("Array cannot have a null element")
@@ -317,6 +389,19 @@ class TestGlobalRecoveryEngine:
         # Reset to original for other tests
         set_recovery_engine(original_engine)
 
+    def test_get_recovery_engine_single_instance_under_contention(
+        self, concurrent_first_use
+    ):
+        """Concurrent first calls construct exactly one RecoveryEngine."""
+        import src.error.recovery as module
+
+        created, results = concurrent_first_use(
+            module, "_default_recovery_engine", "RecoveryEngine", get_recovery_engine
+        )
+
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+
 
 class TestRecoveryEngineIntegration:
     """Integration tests for recovery engine."""
@@ -41,6 +41,16 @@ class TestTimeoutManager:
         result = await manager.with_timeout(fast_operation(), timeout=1)
         assert result == "success"
 
+    @pytest.mark.asyncio
+    async def test_with_timeout_runs_in_calling_task(self):
+        """The operation is awaited in the caller's task, not a wrapper task."""
+        manager = TimeoutManager(default_timeout=1)
+
+        async def current_task():
+            return asyncio.current_task()
+
+        assert await manager.with_timeout(current_task()) is asyncio.current_task()
+
     @pytest.mark.asyncio
     async def test_with_timeout_failure(self):
         """Test operation that times out."""
@@ -1,5 +1,6 @@
 """Tests for Gemini provider implementation."""
 
+import os
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -62,6 +63,41 @@ class TestGeminiProvider:
             model_name="gemini-1.5-pro", safety_settings=provider.SAFETY_SETTINGS
         )
 
+    @patch("src.llm.providers.gemini.genai")
+    def test_get_model_shared_across_providers(self, mock_genai):
+        """Providers for the same model reuse one GenerativeModel."""
+        first = GeminiProvider()._get_model()
+        second = GeminiProvider()._get_model()
+
+        assert first is second
+        mock_genai.GenerativeModel.assert_called_once()
+
+    @patch("src.llm.providers.gemini.genai")
+    def test_get_model_rebuilt_after_api_key_change(self, mock_genai):
+        """A new API key drops models bound to the previous client."""
+        with patch("src.llm.providers.gemini.settings") as mock_settings:
+            mock_settings.model_name = "gemini-1.5-pro"
+            mock_settings.google_api_key = "key-one"
+            GeminiProvider()._get_model()
+
+            mock_settings.google_api_key = "key-two"
+            GeminiProvider()._get_model()
+
+        assert mock_genai.GenerativeModel.call_count == 2
+
+    @patch("src.llm.providers.gemini.genai")
+    def test_get_model_rebuilt_after_env_api_key_change(self, mock_genai):
+        """Environment-only keys are part of the model cache key too."""
+        with patch("src.llm.providers.gemini.settings") as mock_settings:
+            mock_settings.model_name = "gemini-1.5-pro"
+            mock_settings.google_api_key = ""
+            with patch.dict(os.environ, {"GOOGLE_API_KEY": "env-one"}):
+                GeminiProvider()._get_model()
+            with patch.dict(os.environ, {"GOOGLE_API_KEY": "env-two"}):
+                GeminiProvider()._get_model()
+
+        assert mock_genai.GenerativeModel.call_count == 2
+
     @pytest.mark.asyncio
     @patch("src.llm.providers.gemini.genai")
     async def test_generate_text_success(self, mock_genai):
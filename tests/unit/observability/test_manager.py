@@ -228,6 +228,22 @@ class TestConfigIntegration:
             effective = config.effective_observability_config
             assert all(not enabled for enabled in effective.values())
 
+    def test_effective_observability_config_tracks_assignment(self):
+        """Observability can be turned off at runtime after a first read."""
+        with patch.dict(os.environ, {"LGDA_OBSERVABILITY_ENABLED": "true"}):
+            config = LGDAConfig()
+
+            assert config.is_observability_enabled is True
+            assert config.effective_observability_config["metrics"] is True
+
+            config.tracing_enabled = False
+            assert config.effective_observability_config["tracing"] is False
+
+            config.observability_enabled = False
+            assert config.is_observability_enabled is False
+            effective = config.effective_observability_config
+            assert all(not enabled for enabled in effective.values())
+
     def test_config_environment_variables(self):
         """Test configuration via environment variables."""
         with patch.dict(
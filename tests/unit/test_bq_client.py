@@ -5,9 +5,9 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
 import pytest
-from google.api_core.exceptions import BadRequest, Forbidden, NotFound
+from google.api_core.exceptions import BadRequest, Forbidden, NotFound, ServerError
 
-from src.bq import bq_client, get_schema, run_query
+from src.bq import bq_client, get_schema, run_query, run_query_stream
 
 
 class TestBigQueryClient:
@@ -87,6 +87,21 @@ class TestBigQueryClient:
                 assert "query_parameters" in call_args.kwargs
                 assert "maximum_bytes_billed" in call_args.kwargs
 
+    def test_get_schema_converts_rows_via_arrow(
+        self, mock_bigquery_client, sample_schema_response
+    ):
+        """Test that get_schema materializes rows through Arrow when available."""
+        mock_rows = Mock()
+        mock_rows.to_arrow.return_value.to_pylist.return_value = sample_schema_response
+        mock_job = Mock()
+        mock_job.result.return_value = mock_rows
+
+        mock_bigquery_client.query.side_effect = None
+        mock_bigquery_client.query.return_value = mock_job
+
+        assert get_schema(["orders"]) == sample_schema_response
+        mock_rows.to_arrow.assert_called_once_with()
+
     def test_run_query_success(self, mock_bigquery_client, sample_query_result):
         """Test successful query execution."""
         sql = "SELECT * FROM orders WHERE status = 'Complete' LIMIT 10"
@@ -220,6 +235,25 @@ class TestBigQueryClient:
         # Verify to_dataframe is called with create_bqstorage_client=True
         mock_result.to_dataframe.assert_called_once_with(create_bqstorage_client=True)
 
+    def test_run_query_plain_dtypes_opt_in(self, mock_bigquery_client):
+        """Test that plain NumPy dtypes are only used on request."""
+        mock_job = Mock()
+        mock_result = Mock()
+        mock_job.result.return_value = mock_result
+
+        mock_bigquery_client.query.side_effect = None
+        mock_bigquery_client.query.return_value = mock_job
+
+        run_query("SELECT * FROM orders", nullable_dtypes=False)
+
+        mock_result.to_dataframe.assert_called_once_with(
+            create_bqstorage_client=True,
+            bool_dtype=None,
+            int_dtype=None,
+            date_dtype=None,
+            time_dtype=None,
+        )
+
     def test_concurrent_query_execution(self, mock_bigquery_client):
         """Test that multiple queries can be executed concurrently."""
         import threading
@@ -323,3 +357,58 @@ class TestBigQueryClient:
         error_message = str(exc_info.value)
         assert error_message.startswith("BigQuery error:")
         assert "Syntax error at line 1" in error_message
+
+    def test_run_query_stream_returns_arrow_batches(self, mock_bigquery_client):
+        """Test streaming execution yields record batches without a DataFrame."""
+        batches = [Mock(name="batch_1"), Mock(name="batch_2")]
+        mock_result = Mock()
+        mock_result.to_arrow_iterable.return_value = iter(batches)
+        mock_job = Mock()
+        mock_job.result.return_value = mock_result
+
+        mock_bigquery_client.query.side_effect = None
+        mock_bigquery_client.query.return_value = mock_job
+
+        assert list(run_query_stream("SELECT * FROM orders")) == batches
+        mock_result.to_arrow_iterable.assert_called_once_with(bqstorage_client=None)
+        mock_result.to_dataframe.assert_not_called()
+
+    def test_run_query_stream_breaker_tracks_consumption(self, mock_bigquery_client):
+        """Test breaker success is recorded after the last batch, failures mid-stream."""
+
+        def failing_batches():
+            yield Mock(name="batch_1")
+            raise ServerError("stream broke")
+
+        mock_result = Mock()
+        mock_result.to_arrow_iterable.side_effect = [iter([Mock()]), failing_batches()]
+        mock_job = Mock()
+        mock_job.result.return_value = mock_result
+        mock_bigquery_client.query.side_effect = None
+        mock_bigquery_client.query.return_value = mock_job
+
+        with patch("src.bq._circuit_breaker") as breaker:
+            breaker.can_execute.return_value = True
+
+            stream = run_query_stream("SELECT * FROM orders")
+            breaker.record_success.assert_not_called()
+            list(stream)
+            breaker.record_success.assert_called_once()
+
+            stream = run_query_stream("SELECT * FROM orders")
+            next(stream)
+            with pytest.raises(Exception, match="stream broke"):
+                next(stream)
+            breaker.record_failure.assert_called_once()
+            breaker.record_success.assert_called_once()
+
+    def test_run_query_stream_bad_request_error(self, mock_bigquery_client):
+        """Test streaming execution maps BadRequest to ValueError."""
+        mock_job = Mock()
+        mock_job.result.side_effect = BadRequest("Syntax error")
+
+        mock_bigquery_client.query.side_effect = None
+        mock_bigquery_client.query.return_value = mock_job
+
+        with pytest.raises(ValueError, match="BigQuery error:"):
+            run_query_stream("INVALID SQL")
@@ -4,6 +4,7 @@ import os
 import random
 import threading
 import time
+from concurrent.futures import Future
 from typing import Optional
 from unittest.mock import MagicMock, Mock, patch
 
@@ -167,6 +168,26 @@ class TestRetryLogic:
         )
         assert 0.4 <= delay2 <= 0.45  # 400-450ms
 
+    def test_backoff_jitter_bounds(self):
+        """Jitter spans [0, jitter_ms) milliseconds."""
+        rng = Mock()
+        rng.random.return_value = 0.0
+        assert _calculate_backoff_delay(0, 100, 50, rng) == 0.1
+        rng.random.return_value = 0.999
+        assert _calculate_backoff_delay(0, 100, 50, rng) < 0.15
+
+    def test_backoff_ladder_matches_formula(self):
+        """Precomputed ladder and computed delays agree past its end."""
+        from src.bq import _BACKOFF_LADDER_MS, RETRY_BASE_DELAY_MS
+
+        rng = Mock()
+        rng.random.return_value = 0.0
+        for attempt in range(len(_BACKOFF_LADDER_MS) + 2):
+            delay = _calculate_backoff_delay(
+                attempt, base_delay_ms=RETRY_BASE_DELAY_MS, random_gen=rng
+            )
+            assert delay == (2**attempt) * RETRY_BASE_DELAY_MS / 1000.0
+
     def test_error_classification(self):
         """Test error classification for retry logic."""
         # Transient errors
@@ -190,6 +211,24 @@ class TestRetryLogic:
         assert _is_rate_limit_error(ServerError("Server error")) is False
         assert _is_permanent_error(ServerError("Server error")) is False
 
+    def test_error_classification_resolves_subclasses(self):
+        """Subclasses use the retry class of their closest registered base."""
+        from google.api_core.exceptions import InternalServerError
+
+        assert _is_transient_error(InternalServerError("boom")) is True
+        assert _is_permanent_error(InternalServerError("boom")) is False
+        assert _is_transient_error(ValueError("unrelated")) is False
+
+    def test_error_classification_memoized_per_type(self):
+        """Retry classes are resolved once per exception type."""
+        from src.bq import _retry_kind_for_type
+
+        _retry_kind_for_type.cache_clear()
+        _is_transient_error(ServerError("first"))
+        _is_rate_limit_error(ServerError("second"))
+        info = _retry_kind_for_type.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
     def test_retry_after_header_extraction(self):
         """Test extraction of Retry-After header from rate limit errors."""
         # Create a properly mocked error with response
@@ -207,6 +246,13 @@ class TestRetryLogic:
         retry_after = _get_retry_after(simple_error)
         assert retry_after is None
 
+        # Missing or malformed header
+        mock_response.headers = {}
+        assert _get_retry_after(mock_error) is None
+        mock_response.headers = {"Retry-After": "soon"}
+        assert _get_retry_after(mock_error) is None
+        assert _get_retry_after(TooManyRequests("no response")) is None
+
     def test_retry_with_backoff_success(self):
         """Test retry logic with successful execution."""
         call_count = 0
@@ -225,6 +271,27 @@ class TestRetryLogic:
         assert result == "success"
         assert call_count == 2  # Failed once, succeeded on second attempt
 
+    def test_retry_with_backoff_logs_attempt(self, caplog):
+        """Retry warnings carry the attempt, error type and delay."""
+        import logging
+
+        attempts = iter([ServerError("Temporary failure"), None])
+
+        def mock_function():
+            error = next(attempts)
+            if error:
+                raise error
+            return "success"
+
+        caplog.set_level(logging.WARNING)
+        with patch("time.sleep"):
+            _retry_with_backoff(mock_function, max_attempts=3)
+
+        message = caplog.records[-1].getMessage()
+        assert message.startswith("Attempt 1 failed with ")
+        assert "Temporary failure" in message
+        assert "Retrying in" in message
+
     def test_retry_with_backoff_permanent_error(self):
         """Test retry logic with permanent error (no retries)."""
         call_count = 0
@@ -632,3 +699,121 @@ class TestThreadSafety:
 
         # All threads should get the same client instance
         assert len(set(id(client) for client in clients)) == 1
+
+
+class TestQueryCoalescing:
+    """Test coalescing of identical in-flight queries."""
+
+    @pytest.fixture(autouse=True)
+    def coalescing_enabled(self):
+        """Coalescing is opt-in; enable it for these tests."""
+        with patch("src.bq.COALESCE_ENABLED", True):
+            yield
+
+    @staticmethod
+    def _pending(sql, timeout=None):
+        """Register an in-flight query for ``sql`` and return its entry."""
+        import src.bq
+
+        entry = src.bq._InFlightQuery()
+        key = (sql, False, True, timeout or src.bq.TIMEOUT_SEC)
+        return entry, patch.dict(src.bq._in_flight_queries, {key: entry})
+
+    def test_identical_in_flight_query_shares_result(self, mock_bigquery_client):
+        """Test a caller waits on the pending query instead of submitting a job."""
+        entry, registered = self._pending("SELECT 1")
+        entry.future.set_result("shared result")
+
+        with registered:
+            assert run_query("SELECT 1") == "shared result"
+
+        mock_bigquery_client.query.assert_not_called()
+
+    def test_in_flight_exception_propagates_to_waiters(self, mock_bigquery_client):
+        """Test waiters receive the exception raised by the executing caller."""
+        entry, registered = self._pending("SELECT 1")
+        entry.future.set_exception(ValueError("BigQuery error: bad"))
+
+        with registered:
+            with pytest.raises(ValueError, match="BigQuery error: bad"):
+                run_query("SELECT 1")
+
+    def test_waiter_times_out_when_leader_hangs(self, mock_bigquery_client):
+        """Test a waiter without an explicit timeout still gives up on a hung leader."""
+        with patch("src.bq.TIMEOUT_SEC", 0.05):
+            _, registered = self._pending("SELECT 1")
+
+            with registered:
+                with pytest.raises(QueryTimeoutError, match="in-flight query"):
+                    run_query("SELECT 1")
+
+        mock_bigquery_client.query.assert_not_called()
+
+    def test_different_timeout_does_not_coalesce(self, mock_bigquery_client):
+        """Test a caller with another timeout submits its own job."""
+        _, registered = self._pending("SELECT 1", timeout=300)
+
+        with registered:
+            run_query("SELECT 1", timeout=5)
+
+        mock_bigquery_client.query.assert_called_once()
+
+    def test_in_flight_entry_released_after_execution(self, mock_bigquery_client):
+        """Test the in-flight registry is cleared once the query finishes."""
+        import src.bq
+
+        run_query("SELECT 1")
+
+        assert src.bq._in_flight_queries == {}
+
+    def test_concurrent_callers_share_job_but_not_dataframe(self, mock_bigquery_client):
+        """Test two threads share one BigQuery job and get independent frames."""
+        import src.bq
+
+        release = threading.Event()
+        data_job = mock_bigquery_client.query("SELECT 1")
+        mock_bigquery_client.query.reset_mock()
+        to_dataframe = data_job.result.return_value.to_dataframe.return_value
+
+        def blocking_result(timeout=None):
+            release.wait(5)
+            return data_job.result.return_value
+
+        data_job.result.side_effect = blocking_result
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(run_query("SELECT 1")))
+            for _ in range(2)
+        ]
+        threads[0].start()
+        key = ("SELECT 1", False, True, src.bq.TIMEOUT_SEC)
+        deadline = time.monotonic() + 5
+        while key not in src.bq._in_flight_queries and time.monotonic() < deadline:
+            time.sleep(0.001)
+        threads[1].start()
+        while (
+            src.bq._in_flight_queries[key].waiters == 0 and time.monotonic() < deadline
+        ):
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        mock_bigquery_client.query.assert_called_once()
+        first, second = results
+        assert first is not second
+        assert first.equals(second)
+
+        first.drop(first.index, inplace=True)
+        assert len(second) == len(to_dataframe) > 0
+
+    def test_coalescing_can_be_disabled(self, mock_bigquery_client):
+        """Test disabled coalescing always executes the query."""
+        _, registered = self._pending("SELECT 1")
+
+        with patch("src.bq.COALESCE_ENABLED", False):
+            with registered:
+                run_query("SELECT 1")
+
+        mock_bigquery_client.query.assert_called_once()
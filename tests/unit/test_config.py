@@ -322,3 +322,17 @@ class TestConfiguration:
             assert test_settings.bq_location == "EU"
             assert test_settings.model_name == "custom-model"
             assert test_settings.max_bytes_billed == 999999999
+
+    def test_get_settings_reuses_instance_until_env_changes(self):
+        """get_settings() is cached per environment fingerprint."""
+        from src.config import get_settings
+
+        with patch.dict(os.environ, {"BIGQUERY_PROJECT": "p1"}, clear=True):
+            first = get_settings()
+            assert get_settings() is first
+            assert first.bq_project == "p1"
+
+            os.environ["BIGQUERY_PROJECT"] = "p2"
+            second = get_settings()
+            assert second is not first
+            assert second.bq_project == "p2"
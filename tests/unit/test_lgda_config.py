@@ -2,6 +2,8 @@
 
 import os
 import warnings
+from collections.abc import Mapping
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch
 
 import pytest
@@ -14,6 +16,7 @@ from src.config import (
     FeatureFlagManager,
     LGDAConfig,
     PerformanceConfig,
+    get_profile,
 )
 
 
@@ -90,6 +93,21 @@ class TestLGDAConfig:
                 assert any("GOOGLE_API_KEY" in msg for msg in warning_messages)
                 assert any("BIGQUERY_PROJECT" in msg for msg in warning_messages)
 
+    def test_legacy_warnings_can_be_filtered_once(self):
+        """Legacy env warnings use a dedicated DeprecationWarning subclass."""
+        from src.config import LegacyEnvVarWarning
+
+        with patch.dict(os.environ, {"GOOGLE_API_KEY": "legacy-key"}, clear=True):
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("once", LegacyEnvVarWarning)
+                LGDAConfig()
+                os.environ.pop("LGDA_GEMINI_API_KEY")
+                LGDAConfig()
+
+        legacy = [x for x in w if issubclass(x.category, LegacyEnvVarWarning)]
+        assert len(legacy) == 1
+        assert issubclass(LegacyEnvVarWarning, DeprecationWarning)
+
     def test_config_validation_environment(self):
         """Test environment field validation."""
         with patch.dict(os.environ, {"LGDA_ENVIRONMENT": "invalid"}, clear=True):
@@ -148,6 +166,27 @@ class TestCredentialManager:
             assert result["type"] == "service_account"
             assert result["project_id"] == "test"
 
+    def test_bigquery_credentials_decoded_once_per_value(self):
+        """Repeated lookups reuse the decoded JSON but return fresh dicts."""
+        import base64
+        import json
+
+        from src.config import _decode_service_account_json
+
+        encoded_creds = base64.b64encode(
+            json.dumps({"type": "service_account"}).encode()
+        ).decode()
+        _decode_service_account_json.cache_clear()
+
+        with patch.dict(os.environ, {"LGDA_BIGQUERY_CREDENTIALS_JSON": encoded_creds}):
+            cred_manager = CredentialManager(LGDAConfig())
+            first = cred_manager.get_bigquery_credentials()
+            second = cred_manager.get_bigquery_credentials()
+
+            assert first == second
+            assert first is not second
+            assert _decode_service_account_json.cache_info().hits == 1
+
     def test_bigquery_credentials_from_file_path(self):
         """Test BigQuery credentials from file path."""
         test_path = "/path/to/credentials.json"
@@ -200,6 +239,17 @@ class TestCredentialManager:
             assert result["aws_access_key_id"] == "test-access-key"
             assert result["aws_secret_access_key"] == "test-secret-key"
 
+    def test_bedrock_credentials_copies_are_independent(self):
+        """Mutating returned Bedrock credentials does not affect later calls."""
+        with patch.dict(os.environ, {"AWS_ACCESS_KEY_ID": "key-1"}, clear=True):
+            cred_manager = CredentialManager(LGDAConfig())
+            first = cred_manager.get_bedrock_credentials()
+            first["aws_access_key_id"] = "tampered"
+
+            assert cred_manager.get_bedrock_credentials()["aws_access_key_id"] == (
+                "key-1"
+            )
+
     def test_sensitive_data_masking(self):
         """Test that sensitive data is masked for logging."""
         config = LGDAConfig()
@@ -306,6 +356,14 @@ class TestPerformanceConfig:
         assert perf_config.max_dataframe_rows == 50000
         assert perf_config.max_memory_mb == 1024
 
+    def test_performance_config_for_environment_is_cached(self):
+        """Environment performance configs are shared, immutable instances."""
+        perf_config = PerformanceConfig.for_environment("production")
+
+        assert PerformanceConfig.for_environment("production") is perf_config
+        with pytest.raises(FrozenInstanceError):
+            perf_config.query_timeout = 1
+
 
 class TestConfigFactory:
     """Test configuration factory."""
@@ -340,9 +398,23 @@ class TestConfigFactory:
 
         for env_name, profile in ENVIRONMENT_PROFILES.items():
             assert profile.name == env_name
-            assert isinstance(profile.config_overrides, dict)
-            assert isinstance(profile.feature_flags, dict)
-            assert isinstance(profile.performance_settings, dict)
+            assert isinstance(profile.config_overrides, Mapping)
+            assert isinstance(profile.feature_flags, Mapping)
+            assert isinstance(profile.performance_settings, Mapping)
+
+    def test_get_profile_returns_shared_frozen_profile(self):
+        """get_profile() hands out the same immutable profile objects."""
+        profile = get_profile("staging")
+        assert get_profile("staging") is profile
+        assert profile.name == "staging"
+
+        with pytest.raises(FrozenInstanceError):
+            profile.name = "other"
+        with pytest.raises(TypeError):
+            profile.config_overrides["debug"] = True
+        with pytest.raises(TypeError):
+            profile.performance_settings["query_timeout"] = 1
+        assert get_profile("staging").performance_settings["query_timeout"] != 1
 
 
 class TestConfigIntegration:
@@ -415,3 +487,64 @@ class TestConfigIntegration:
                 # Check warning messages mention migration
                 messages = [str(warning.message) for warning in deprecation_warnings]
                 assert any("migrate to LGDA_" in msg for msg in messages)
+
+
+class TestConfigFactoryCaching:
+    """Test create_config memoization."""
+
+    def test_create_config_reuses_instance_for_same_environment(self):
+        ConfigFactory.invalidate()
+        with patch.dict(os.environ, {"LGDA_ENVIRONMENT": "staging"}, clear=True):
+            first = ConfigFactory.create_config()
+            again = ConfigFactory.create_config()
+            assert again == first
+            assert again is not first
+
+        with patch.dict(os.environ, {"LGDA_ENVIRONMENT": "production"}, clear=True):
+            other = ConfigFactory.create_config()
+            assert other is not first
+            assert other.environment == "production"
+
+    def test_create_config_validates_once_per_environment(self):
+        ConfigFactory.invalidate()
+        with patch.dict(os.environ, {"LGDA_ENVIRONMENT": "staging"}, clear=True):
+            with patch.object(
+                LGDAConfig, "__init__", autospec=True, side_effect=LGDAConfig.__init__
+            ) as init:
+                ConfigFactory.create_config()
+                ConfigFactory.create_config()
+                assert init.call_count == 1
+
+                ConfigFactory.invalidate()
+                ConfigFactory.create_config()
+                assert init.call_count == 2
+
+    def test_create_config_copies_are_independent(self):
+        with patch.dict(os.environ, {"LGDA_ENVIRONMENT": "staging"}, clear=True):
+            first = ConfigFactory.create_config()
+            first.sql_max_limit = 1
+            first.allowed_tables.append("secrets")
+            second = ConfigFactory.create_config()
+            assert second.sql_max_limit == 500
+            assert "secrets" not in second.allowed_tables
+
+    def test_create_fast_reads_hot_fields_without_full_config(self):
+        env = {
+            "LGDA_BIGQUERY_PROJECT_ID": "fast-project",
+            "GOOGLE_API_KEY": "legacy-key",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            with patch.object(ConfigFactory, "create_config") as create_config:
+                fast = ConfigFactory.create_fast()
+                assert fast.bigquery_project_id == "fast-project"
+                assert fast.gemini_api_key == "legacy-key"
+                assert fast.bigquery_location == "US"
+                create_config.assert_not_called()
+
+    def test_create_fast_delegates_cold_fields(self):
+        with patch.dict(os.environ, {"LGDA_ENVIRONMENT": "staging"}, clear=True):
+            fast = ConfigFactory.create_fast()
+            assert fast.environment == "staging"
+            assert fast.sql_max_limit == 500
+            with pytest.raises(AttributeError):
+                fast.not_a_config_field
@@ -336,3 +336,73 @@ class TestLLMClient:
         # Test with empty string model (should use default)
         result = llm_completion(prompt, model="")
         mock_gemini_client.GenerativeModel.assert_called_with("gemini-1.5-pro")
+
+    def test_run_sync_reuses_background_loop(self):
+        """Sync wrapper runs coroutines on one persistent background loop."""
+        import asyncio
+
+        from src.llm.compat import _run_sync
+
+        async def running_loop():
+            return asyncio.get_running_loop()
+
+        first = _run_sync(running_loop(), timeout=5)
+        assert _run_sync(running_loop(), timeout=5) is first
+
+        # Also usable from code that already has a running loop
+        async def caller():
+            return _run_sync(running_loop(), timeout=5), asyncio.get_running_loop()
+
+        inner, outer = asyncio.run(caller())
+        assert inner is first
+        assert inner is not outer
+
+    def test_run_sync_propagates_caller_context(self):
+        """Coroutines on the background loop see the caller's contextvars."""
+        import contextvars
+
+        from src.llm.compat import _run_sync
+
+        request_id = contextvars.ContextVar("request_id", default=None)
+
+        async def read_request_id():
+            return request_id.get()
+
+        token = request_id.set("req-123")
+        try:
+            assert _run_sync(read_request_id(), timeout=5) == "req-123"
+        finally:
+            request_id.reset(token)
+
+    def test_run_sync_times_out_and_cancels(self):
+        """A stuck coroutine raises TimeoutError and is cancelled."""
+        import asyncio
+        import threading
+
+        from src.llm.compat import _run_sync
+
+        cancelled = threading.Event()
+
+        async def stuck():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError, match="within 0.05s"):
+            _run_sync(stuck(), timeout=0.05)
+        assert cancelled.wait(5)
+
+    def test_synthetic_response_rule_order(self):
+        """Synthetic responses honor each rule table's keyword priority."""
+        from src.llm.compat import (
+            _PLAN_FIRST_RULES,
+            _SQL_FIRST_RULES,
+            _synthetic_response,
+        )
+
+        prompt = "Write SQL for this JSON plan"
+        assert _synthetic_response(prompt, _SQL_FIRST_RULES).startswith("SELECT")
+        assert _synthetic_response(prompt, _PLAN_FIRST_RULES).startswith("{")
+        assert _synthetic_response(None, _SQL_FIRST_RULES).startswith("Executive")
@@ -14,6 +14,7 @@ from src.configuration.unified import (
     get_performance_config,
     get_security_config,
     get_unified_config,
+    reset_unified_config,
 )
 
 
@@ -76,6 +77,34 @@ class TestLLMConfig:
         assert config.get_temperature_for_context("general") == 0.0
         assert config.get_temperature_for_context("unknown") == 0.0  # fallback
 
+    def test_context_getters_reflect_assignment_after_read(self):
+        """Fields assigned after a first lookup are returned by later lookups."""
+        config = LLMConfig()
+
+        config.max_tokens_sql_generation = 1111
+        config.temperature_analysis = 0.5
+        assert config.get_max_tokens_for_context("sql_generation") == 1111
+        assert config.get_temperature_for_context("analysis") == 0.5
+
+        config.max_tokens_sql_generation = 2222
+        config.temperature_analysis = 0.7
+        assert config.get_max_tokens_for_context("sql_generation") == 2222
+        assert config.get_temperature_for_context("analysis") == 0.7
+
+    def test_context_getters_accept_llm_context(self):
+        """LLMContext members resolve to the same values as their names."""
+        from src.llm.models import LLMContext
+
+        config = LLMConfig()
+
+        for context in LLMContext:
+            assert config.get_max_tokens_for_context(
+                context
+            ) == config.get_max_tokens_for_context(context.value.upper())
+            assert config.get_temperature_for_context(
+                context
+            ) == config.get_temperature_for_context(context.value)
+
 
 class TestBigQueryConfig:
     """Test BigQuery configuration class."""
@@ -210,6 +239,41 @@ class TestUnifiedConfig:
         assert config.performance.max_dataframe_rows == 50000
         assert config.performance.enable_query_cache is True
 
+    def test_create_for_environment_is_memoized_copy(self):
+        """Environment configs are built once and handed out as copies."""
+        import src.configuration.unified as unified
+
+        unified._environment_config.cache_clear()
+        first = UnifiedConfig.create_for_environment("development")
+        first.security.default_query_limit = 5
+        second = UnifiedConfig.create_for_environment("development")
+
+        assert second is not first
+        assert second.security.default_query_limit == 100
+        assert unified._environment_config.cache_info().hits == 1
+
+    def test_sub_configs_validated_once_per_environment(self):
+        """Sub-configs are built once per env and handed out as copies."""
+        import src.configuration.unified as unified
+
+        unified._settings_prototype.cache_clear()
+        with patch.dict(os.environ, {"LGDA_LLM_REQUEST_TIMEOUT": "45"}, clear=True):
+            with patch.object(
+                LLMConfig, "__init__", autospec=True, side_effect=LLMConfig.__init__
+            ) as init:
+                configs = [UnifiedConfig() for _ in range(3)]
+                assert init.call_count == 1
+
+            first, second, _ = configs
+            assert len({id(config.llm) for config in configs}) == len(configs)
+            assert all(config.llm == first.llm for config in configs)
+            assert first.llm.request_timeout == 45
+            first.security.allowed_tables.append("secrets")
+            assert "secrets" not in second.security.allowed_tables
+
+        with patch.dict(os.environ, {"LGDA_LLM_REQUEST_TIMEOUT": "90"}, clear=True):
+            assert UnifiedConfig().llm.request_timeout == 90
+
 
 class TestConfigurationAccessors:
     """Test configuration accessor functions."""
@@ -242,6 +306,41 @@ class TestConfigurationAccessors:
         # Should be the same cached instance
         assert config1 is config2
 
+    def test_reset_unified_config_picks_up_env_changes(self):
+        """reset_unified_config drops the singleton so env changes apply."""
+        reset_unified_config()
+        try:
+            with patch.dict(os.environ, {"LGDA_BQ_QUERY_TIMEOUT": "600"}):
+                first = get_unified_config()
+                assert first.bigquery.query_timeout == 600
+
+                os.environ["LGDA_BQ_QUERY_TIMEOUT"] = "900"
+                assert get_unified_config() is first
+
+                reset_unified_config()
+                second = get_unified_config()
+                assert second is not first
+                assert second.bigquery.query_timeout == 900
+
+                # lru_cache-style reset is kept for existing callers
+                get_unified_config.cache_clear()
+                assert get_unified_config() is not second
+        finally:
+            reset_unified_config()
+
+    def test_get_unified_config_single_instance_under_contention(
+        self, concurrent_first_use
+    ):
+        """Concurrent first calls construct exactly one UnifiedConfig."""
+        import src.configuration.unified as module
+
+        created, results = concurrent_first_use(
+            module, "_unified_config", "UnifiedConfig", get_unified_config
+        )
+
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+
 
 class TestConfigurationConsolidation:
     """Test that configuration consolidation eliminates hardcoded values."""